@@ -2,12 +2,16 @@
 GeoLLM - Natural Language Geographic Query Parsing
 
 Parse location queries into structured geographic queries using LLM.
+
+The parser, datasources and spatial operations are imported lazily on first
+attribute access, so that importing ``geollm`` does not pull in LangChain,
+GeoPandas or Shapely until they are actually used.
 """
 
-# Main API
+import importlib
+from typing import TYPE_CHECKING, Any
+
 # Exceptions
-# Datasources
-from .datasources import GeoDataSource, SwissNames3DSource
 from .exceptions import (
     GeoFilterError,
     LowConfidenceError,
@@ -26,13 +30,23 @@ from .models import (
     ReferenceLocation,
     SpatialRelation,
 )
-from .parser import GeoFilterParser
-
-# Spatial operations
-from .spatial import apply_spatial_relation
 
 # Configuration
-from .spatial_config import RelationConfig, SpatialRelationConfig
+from .spatial_config import RelationCategory, RelationConfig, SpatialRelationConfig
+
+if TYPE_CHECKING:
+    from .datasources import GeoDataSource, SwissNames3DSource
+    from .parser import GeoFilterParser
+    from .spatial import apply_spatial_relation, apply_spatial_relation_batch
+
+# Lazily imported names → module providing them
+_LAZY = {
+    "GeoFilterParser": ".parser",
+    "GeoDataSource": ".datasources",
+    "SwissNames3DSource": ".datasources",
+    "apply_spatial_relation": ".spatial",
+    "apply_spatial_relation_batch": ".spatial",
+}
 
 __all__ = [
     # Main API
@@ -47,6 +61,7 @@ __all__ = [
     # Configuration
     "SpatialRelationConfig",
     "RelationConfig",
+    "RelationCategory",
     # Exceptions
     "GeoFilterError",
     "ParsingError",
@@ -59,4 +74,19 @@ __all__ = [
     "SwissNames3DSource",
     # Spatial
     "apply_spatial_relation",
+    "apply_spatial_relation_batch",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import heavy submodules on first access (PEP 562)."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is only hit once per name
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
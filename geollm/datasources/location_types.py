@@ -10,9 +10,14 @@ to support fuzzy matching. For example, querying type="water" matches features
 of type "lake", "river", "pond", etc.
 """
 
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
 # Type hierarchy: category → list of concrete types
 # This enables fuzzy matching (category matches multiple concrete types)
-TYPE_HIERARCHY: dict[str, list[str]] = {
+_TYPE_HIERARCHY: dict[str, list[str]] = {
     "water": [
         "lake",
         "river",
@@ -123,6 +128,15 @@ TYPE_HIERARCHY: dict[str, list[str]] = {
     ],
 }
 
+# Public, read-only view of the hierarchy: tuples of interned strings, so it cannot be
+# mutated by accident and type names compare by identity across modules
+TYPE_HIERARCHY: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        sys.intern(category): tuple(sys.intern(concrete_type) for concrete_type in types)
+        for category, types in _TYPE_HIERARCHY.items()
+    }
+)
+
 # Flatten hierarchy for easy lookup: concrete_type → category
 TYPE_TO_CATEGORY: dict[str, str] = {}
 for category, types in TYPE_HIERARCHY.items():
@@ -135,12 +149,58 @@ ALL_TYPES: list[str] = sorted(set(TYPE_TO_CATEGORY.keys()))
 # All categories
 ALL_CATEGORIES: list[str] = sorted(TYPE_HIERARCHY.keys())
 
+# Unified lookup: concrete type → itself, category → its concrete types.
+# Categories are inserted last so they win when a name is both (e.g. "island").
+_MATCH_TABLE: dict[str, tuple[str, ...]] = {concrete_type: (concrete_type,) for concrete_type in TYPE_TO_CATEGORY}
+_MATCH_TABLE.update(TYPE_HIERARCHY)
+
+# Character trie over all types and categories for prefix matching.
+# Each node maps a character to its child node; "$" marks a terminal.
+_TRIE_TERMINAL = "$"
+_TYPE_TRIE: dict[str, Any] = {}
+for type_name in ALL_TYPES + ALL_CATEGORIES:
+    trie_node = _TYPE_TRIE
+    for char in type_name:
+        trie_node = trie_node.setdefault(char, {})
+    trie_node[_TRIE_TERMINAL] = type_name
+
 
-def normalize_type(type_hint: str | None) -> str | None:
+def prefix_match(prefix: str) -> list[str]:
+    """
+    Get all types and categories starting with a prefix.
+
+    Examples:
+        prefix_match("lak") → ["lake"]
+        prefix_match("rail") → ["railway", "railway_area"]
+        prefix_match("xyz") → []
+    """
+    node = _TYPE_TRIE
+    for char in prefix:
+        node = node.get(char)
+        if node is None:
+            return []
+
+    matches: list[str] = []
+    stack: list[dict[str, Any]] = [node]
+    while stack:
+        node = stack.pop()
+        for key, child in node.items():
+            if key == _TRIE_TERMINAL:
+                matches.append(child)
+            else:
+                stack.append(child)
+    return sorted(matches)
+
+
+def normalize_type(type_hint: str | None, allow_prefix: bool = False) -> str | None:
     """
     Normalize a type hint. If it's a concrete type, return as-is.
     If it's a category, keep as-is (will be used for fuzzy matching).
     If it's not in the hierarchy, convert to lowercase.
+
+    With allow_prefix=True, an unknown hint that is the prefix of exactly one type or
+    category resolves to it (e.g. truncated LLM output: "hospit" → "hospital").
+    Ambiguous prefixes are left as-is.
     """
     if type_hint is None:
         return None
@@ -151,6 +211,11 @@ def normalize_type(type_hint: str | None) -> str | None:
     if lowered in TYPE_TO_CATEGORY or lowered in TYPE_HIERARCHY:
         return lowered
 
+    if allow_prefix and lowered:
+        candidates = prefix_match(lowered)
+        if len(candidates) == 1:
+            return candidates[0]
+
     # Unknown type - return lowered
     return lowered
 
@@ -164,17 +229,4 @@ def get_matching_types(type_hint: str) -> list[str]:
         get_matching_types("water") → ["lake", "river", "pond", "spring", ...]
         get_matching_types("unknown") → ["unknown"]
     """
-    normalized = normalize_type(type_hint)
-    if not normalized:
-        return []
-
-    # If it's a category, return all concrete types in that category
-    if normalized in TYPE_HIERARCHY:
-        return TYPE_HIERARCHY[normalized]
-
-    # If it's a concrete type, return it
-    if normalized in TYPE_TO_CATEGORY:
-        return [normalized]
-
-    # Unknown type - return empty (no match)
-    return []
+    return list(_MATCH_TABLE.get(type_hint.lower().strip(), ()))
@@ -7,15 +7,24 @@ search functionality with coordinate conversion to WGS84 GeoJSON.
 Data source: https://www.swisstopo.admin.ch/en/landscape-model-swissnames3d
 """
 
+import importlib.util
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyogrio
 import pyproj
-from rapidfuzz import fuzz
+import shapely
+from rapidfuzz import fuzz, process
 from shapely.geometry import mapping
 
+# Arrow-backed string columns need the optional pyarrow package
+_ARROW_STRINGS = importlib.util.find_spec("pyarrow") is not None
+
 # CH1903+ (LV95) to WGS84 transformer - data is assumed to always be in EPSG:2056
 _TRANSFORMER = pyproj.Transformer.from_crs("EPSG:2056", "EPSG:4326", always_xy=True)
 
@@ -150,6 +159,49 @@ def _objektart_to_type(objektart: str) -> str:
     return objektart.lower()
 
 
+def _project_coords(coords: np.ndarray) -> np.ndarray:
+    """Project an (N, 2) or (N, 3) EPSG:2056 coordinate array to WGS84 in one PROJ call."""
+    return np.column_stack(_TRANSFORMER.transform(*coords.T))
+
+
+def _to_wgs84(geoms: np.ndarray) -> np.ndarray:
+    """
+    Reproject an array of EPSG:2056 geometries to WGS84.
+
+    All coordinates are transformed in bulk (one call for 2D and one for 3D geometries,
+    keeping each geometry's dimensionality) instead of per geometry part.
+    """
+    result = np.array(geoms, dtype=object)
+    has_z = shapely.has_z(result)
+    for include_z in (False, True):
+        mask = has_z == include_z
+        if mask.any():
+            result[mask] = shapely.transform(result[mask], _project_coords, include_z=include_z)
+    return result
+
+
+def _has_value(val: Any) -> bool:
+    """Whether a cell holds a usable value: neither missing (None, NaN, pd.NA) nor empty."""
+    return not pd.isna(val) and bool(val)
+
+
+def _compact_columns(gdf: gpd.GeoDataFrame, type_col: str | None) -> None:
+    """
+    Store the attribute columns of a loaded GeoDataFrame compactly, in place.
+
+    The type column has only a few distinct values and becomes categorical. Other
+    string columns become Arrow-backed strings when pyarrow is installed, instead
+    of one Python object per cell. Missing values then read back as pd.NA.
+    """
+    for col in gdf.columns:
+        if col == gdf.geometry.name:
+            continue
+        if col == type_col:
+            gdf[col] = gdf[col].astype("category")
+        elif _ARROW_STRINGS and gdf[col].dtype == object and pd.api.types.infer_dtype(gdf[col]) == "string":
+            gdf[col] = gdf[col].astype(pd.StringDtype("pyarrow"))
+
+
 def _normalize_name(name: str) -> str:
     """
     Normalize a name for case-insensitive, accent-insensitive matching.
@@ -178,6 +230,8 @@ class SwissNames3DSource:
     Args:
         data_path: Path to SwissNames3D data file or directory containing SwissNames3D shapefiles.
         layer: Layer name within the data source (for multi-layer formats like GDB).
+        bbox: Optional (minx, miny, maxx, maxy) box in the data's CRS (EPSG:2056). Only
+            features intersecting it are read, which makes loading a small region much faster.
 
     Example:
         >>> source = SwissNames3DSource("data/")  # Load all 3 geometry types
@@ -185,11 +239,45 @@ class SwissNames3DSource:
         >>> print(results[0].geometry)  # GeoJSON in WGS84
     """
 
-    def __init__(self, data_path: str | Path, layer: str | None = None) -> None:
+    def __init__(
+        self,
+        data_path: str | Path,
+        layer: str | None = None,
+        bbox: tuple[float, float, float, float] | None = None,
+    ) -> None:
         self._data_path = Path(data_path)
         self._layer = layer
+        self._bbox = bbox
         self._gdf: gpd.GeoDataFrame | None = None
         self._name_index: dict[str, list[int]] = {}
+        # Inverted index for fuzzy search: token → positions of the names containing it
+        # in _name_index (in insertion order, so results keep the same ordering)
+        self._index_names: list[str] = []
+        self._token_index: dict[str, list[int]] = {}
+        # Geometries reprojected to WGS84 once at load, aligned with _gdf rows
+        self._wgs84_geoms: np.ndarray = np.empty(0, dtype=object)
+        # Normalized type → sorted row indices, for the type filter of search
+        self._type_index: dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_geodataframe(cls, gdf: gpd.GeoDataFrame) -> "SwissNames3DSource":
+        """
+        Create a source over an already loaded SwissNames3D GeoDataFrame.
+
+        The frame must be in EPSG:2056 with the SwissNames3D columns (e.g. one read back
+        from a GeoParquet copy). It goes through the same post-load steps as data read
+        from disk: column compaction and index building. The given frame is not modified.
+
+        Args:
+            gdf: SwissNames3D features in EPSG:2056.
+
+        Returns:
+            A ready-to-search SwissNames3DSource (no data path is read).
+        """
+        source = cls(Path())
+        # Compaction only reassigns whole columns, so a shallow copy keeps gdf's dtypes
+        source._set_data(gdf.copy(deep=False))
+        return source
 
     def _ensure_loaded(self) -> None:
         """Load data lazily on first access."""
@@ -207,34 +295,56 @@ class SwissNames3DSource:
             kwargs: dict[str, Any] = {}
             if self._layer is not None:
                 kwargs["layer"] = self._layer
+            if self._bbox is not None:
+                kwargs["bbox"] = self._bbox
             self._gdf = gpd.read_file(str(self._data_path), **kwargs)
 
+        assert self._gdf is not None
+        self._set_data(self._gdf)
+
+    def _set_data(self, gdf: gpd.GeoDataFrame) -> None:
+        """Adopt a loaded GeoDataFrame: compact its columns and build the lookup structures."""
+        self._gdf = gdf
+        _compact_columns(gdf, self._detect_type_column())
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Build the lookup structures derived from the loaded GeoDataFrame."""
+        assert self._gdf is not None
         self._build_name_index()
+        self._build_token_index()
+        self._build_type_index()
+        self._wgs84_geoms = _to_wgs84(self._gdf.geometry.values)
 
     def _load_from_directory(self) -> None:
         """Load and concatenate all SwissNames3D shapefiles from a directory."""
         # Look for the 3 standard SwissNames3D shapefiles
         shapefile_names = ["swissNAMES3D_PKT", "swissNAMES3D_LIN", "swissNAMES3D_PLY"]
-        gdfs: list[gpd.GeoDataFrame] = []
+        shp_paths = [self._data_path / f"{name}.shp" for name in shapefile_names]
+        shp_paths = [path for path in shp_paths if path.exists()]
 
-        for name in shapefile_names:
-            shp_path = self._data_path / f"{name}.shp"
-            if shp_path.exists():
-                gdf = gpd.read_file(str(shp_path))
-                gdfs.append(gdf)
-
-        if not gdfs:
+        if not shp_paths:
             raise ValueError(
                 f"No SwissNames3D shapefiles found in {self._data_path}. Expected: {', '.join(shapefile_names)}"
             )
 
-        # Find common columns across all loaded GeoDataFrames
-        common_cols = set(gdfs[0].columns)
-        for gdf in gdfs[1:]:
-            common_cols &= set(gdf.columns)
-
-        # Keep only common columns and concatenate
-        gdfs_filtered = [gdf[sorted(common_cols)] for gdf in gdfs]
+        # Find the attribute columns common to all files from their headers, so that
+        # file-specific columns are never decoded
+        common_cols = set(pyogrio.read_info(shp_paths[0])["fields"])
+        for path in shp_paths[1:]:
+            common_cols &= set(pyogrio.read_info(path)["fields"])
+        columns = sorted(common_cols)
+
+        # Read only common columns and concatenate; GDAL releases the GIL while decoding,
+        # so the files are read concurrently
+        with ThreadPoolExecutor(max_workers=len(shp_paths)) as executor:
+            gdfs = list(
+                executor.map(
+                    lambda path: gpd.read_file(str(path), columns=columns, bbox=self._bbox, engine="pyogrio"),
+                    shp_paths,
+                )
+            )
+        gdfs_filtered = [gdf[sorted([*columns, "geometry"])] for gdf in gdfs]
         self._gdf = gpd.GeoDataFrame(
             gpd.pd.concat(gdfs_filtered, ignore_index=True), crs=gdfs[0].crs, geometry="geometry"
         )
@@ -242,16 +352,44 @@ class SwissNames3DSource:
     def _build_name_index(self) -> None:
         """Build a normalized name → row indices lookup for fast search."""
         assert self._gdf is not None
+
+        # Names repeat a lot (e.g. the same place as point and polygon), so each
+        # distinct name is normalized once and rows are grouped by integer codes
+        name_codes, names = pd.factorize(self._gdf[self._detect_name_column()])  # Missing names → -1
+        normalized = [_normalize_name(name) if isinstance(name, str) else "" for name in names]
+        key_codes, keys = pd.factorize(np.asarray(normalized, dtype=object))
+        row_keys = np.where(name_codes >= 0, key_codes[name_codes], -1)
+
+        # Group row positions by normalized name, in order of first appearance
+        groups = pd.Series(np.arange(len(row_keys))).groupby(row_keys, sort=False).indices
         self._name_index = {}
+        for key, group in groups.items():
+            code = cast(int, key)  # Group keys are the integer codes of row_keys
+            if code >= 0 and keys[code]:
+                self._name_index[keys[code]] = group.tolist()
+
+    def _build_token_index(self) -> None:
+        """Build the token → indexed name positions lookup used by fuzzy search."""
+        self._index_names = list(self._name_index)
+        self._token_index = {}
+        for position, indexed_name in enumerate(self._index_names):
+            for token in set(indexed_name.split()):
+                self._token_index.setdefault(token, []).append(position)
+
+    def _build_type_index(self) -> None:
+        """Build a normalized type → row indices lookup for the search type filter."""
+        assert self._gdf is not None
+        type_col = self._detect_type_column()
+        if type_col is None:
+            self._type_index = {"unknown": np.arange(len(self._gdf))}
+            return
 
-        name_col = self._detect_name_column()
-        for idx, name in enumerate(self._gdf[name_col]):
-            if not isinstance(name, str) or not name.strip():
-                continue
-            normalized = _normalize_name(name)
-            if normalized not in self._name_index:
-                self._name_index[normalized] = []
-            self._name_index[normalized].append(idx)
+        # Map each distinct OBJEKTART once; missing values (code -1) pick the trailing "unknown"
+        codes, values = pd.factorize(self._gdf[type_col])
+        types = [_objektart_to_type(str(val)) if _has_value(val) else "unknown" for val in values]
+        row_types = np.asarray([*types, "unknown"], dtype=object)[codes]
+        groups = pd.Series(np.arange(len(codes))).groupby(row_types, sort=False).indices
+        self._type_index = {str(type_name): rows for type_name, rows in groups.items()}
 
     def _detect_name_column(self) -> str:
         """Detect the name column in the data."""
@@ -277,63 +415,65 @@ class SwissNames3DSource:
                 return candidate
         return None
 
-    def _row_to_feature(self, idx: int) -> dict[str, Any]:
-        """Convert a GeoDataFrame row to a GeoJSON Feature dict with WGS84 geometry."""
+    def _rows_to_features(self, indices: list[int]) -> list[dict[str, Any]]:
+        """Convert GeoDataFrame rows to GeoJSON Feature dicts with WGS84 geometry."""
         assert self._gdf is not None
-        row = self._gdf.iloc[idx]
+        if not indices:
+            return []
 
-        # Get name
+        # Resolve the columns once per call rather than once per row
         name_col = self._detect_name_column()
-        name = str(row[name_col])
-
-        # Get type
         type_col = self._detect_type_column()
-        raw_type = str(row[type_col]) if type_col and row.get(type_col) else "unknown"
-        normalized_type = _objektart_to_type(raw_type)
-
-        # Get ID
         id_col = self._detect_id_column()
-        feature_id = str(row[id_col]) if id_col and row.get(id_col) else str(idx)
-
-        # Convert geometry to WGS84 GeoJSON
-        geom = row.geometry
-        if geom is None or geom.is_empty:
-            geometry = {"type": "Point", "coordinates": [0, 0]}
-            bbox = None
-        else:
-            # Transform geometry from EPSG:2056 to WGS84 using the module-level transformer
-            from shapely.ops import transform as shapely_transform
-
-            wgs84_geom = shapely_transform(_TRANSFORMER.transform, geom)
-            geometry = mapping(wgs84_geom)
-            bounds = wgs84_geom.bounds  # (minx, miny, maxx, maxy)
-            bbox = (bounds[0], bounds[1], bounds[2], bounds[3])
-
-        # Collect extra properties
         skip_cols = {name_col, "geometry"}
         if type_col:
             skip_cols.add(type_col)
         if id_col:
             skip_cols.add(id_col)
-
-        properties: dict[str, Any] = {
-            "name": name,
-            "type": normalized_type,
-            "confidence": 1.0,
-        }
-        for col in self._gdf.columns:
-            if col not in skip_cols:
-                val = row.get(col)
-                if val is not None and str(val) != "nan":
+        columns = [col for col in self._gdf.columns if col != "geometry"]
+
+        # Take all requested rows in one slice and walk them as plain tuples
+        rows = self._gdf.iloc[indices][columns].itertuples(index=False, name=None)
+        features = []
+        for idx, values, wgs84_geom in zip(indices, rows, self._wgs84_geoms[indices], strict=True):
+            row = dict(zip(columns, values, strict=True))
+
+            name = str(row[name_col])
+
+            raw_type = str(row[type_col]) if type_col and _has_value(row[type_col]) else "unknown"
+            normalized_type = _objektart_to_type(raw_type)
+
+            feature_id = str(row[id_col]) if id_col and _has_value(row[id_col]) else str(idx)
+
+            # Convert geometry to GeoJSON
+            if wgs84_geom is None or wgs84_geom.is_empty:
+                geometry = {"type": "Point", "coordinates": [0, 0]}
+                bbox = None
+            else:
+                geometry = mapping(wgs84_geom)
+                bounds = wgs84_geom.bounds  # (minx, miny, maxx, maxy)
+                bbox = (bounds[0], bounds[1], bounds[2], bounds[3])
+
+            # Collect extra properties
+            properties: dict[str, Any] = {
+                "name": name,
+                "type": normalized_type,
+                "confidence": 1.0,
+            }
+            for col, val in row.items():
+                if col not in skip_cols and not pd.isna(val):
                     properties[col] = val
 
-        return {
-            "type": "Feature",
-            "id": feature_id,
-            "geometry": geometry,
-            "bbox": bbox,
-            "properties": properties,
-        }
+            features.append(
+                {
+                    "type": "Feature",
+                    "id": feature_id,
+                    "geometry": geometry,
+                    "bbox": bbox,
+                    "properties": properties,
+                }
+            )
+        return features
 
     def search(
         self,
@@ -358,7 +498,37 @@ class SwissNames3DSource:
             List of matching GeoJSON Feature dicts. If type is provided, only
             features of that type are returned. Empty list if no matches found.
         """
+        return self._rows_to_features(self._match_indices(name, type, max_results))
+
+    def search_df(
+        self,
+        name: str,
+        type: str | None = None,
+        max_results: int = 10,
+    ) -> gpd.GeoDataFrame:
+        """
+        Search for geographic features by name, returning the matching rows as a GeoDataFrame.
+
+        Matches the same features as search(), in the same order, but skips building
+        GeoJSON dicts: rows keep the raw columns (NAME, OBJEKTART, ...) and geometries
+        stay in the data's CRS (EPSG:2056). Handy for column-wise checks on the results.
+
+        Args:
+            name: Location name to search for.
+            type: Optional type hint to filter results (see search()).
+            max_results: Maximum number of results to return.
+
+        Returns:
+            GeoDataFrame slice of the matching rows. Empty if no matches found.
+        """
+        indices = self._match_indices(name, type, max_results)
+        assert self._gdf is not None
+        return self._gdf.iloc[indices]
+
+    def _match_indices(self, name: str, type: str | None, max_results: int) -> list[int]:
+        """Find the row indices matching a search, filtered by type and truncated to max_results."""
         self._ensure_loaded()
+        assert self._gdf is not None
 
         normalized = _normalize_name(name)
         indices = self._name_index.get(normalized, [])
@@ -367,14 +537,15 @@ class SwissNames3DSource:
         if not indices:
             indices = self._fuzzy_search(normalized)
 
-        features = [self._row_to_feature(idx) for idx in indices]
-
-        # Filter by type if type hint provided
+        # Filter by type if type hint provided, keeping the match order
         if type is not None:
-            normalized_type = type.lower()
-            features = [f for f in features if f["properties"].get("type") == normalized_type]
+            type_rows = self._type_index.get(type.lower())
+            if type_rows is None:
+                indices = []
+            elif indices:
+                indices = np.asarray(indices)[np.isin(indices, type_rows)].tolist()
 
-        return features[:max_results]
+        return indices[:max_results]
 
     def _fuzzy_search(self, normalized: str, threshold: float = 75.0) -> list[int]:
         """
@@ -392,25 +563,20 @@ class SwissNames3DSource:
         Returns:
             List of row indices for fuzzy-matched names, sorted by score (descending).
         """
-        matches: list[tuple[int, float]] = []
         query_tokens = set(normalized.split())
 
-        for indexed_name, indices in self._name_index.items():
-            indexed_tokens = set(indexed_name.split())
-
-            # Check if any query token matches any indexed token
-            token_overlap = query_tokens & indexed_tokens
+        # Only names sharing at least one token with the query are candidates
+        candidates: set[int] = set()
+        for token in query_tokens:
+            candidates.update(self._token_index.get(token, ()))
+        candidate_names = [self._index_names[position] for position in sorted(candidates)]
 
-            if token_overlap:
-                # Also use token_set_ratio for better matching of partial strings
-                score = fuzz.token_set_ratio(normalized, indexed_name)
-                if score >= threshold:
-                    for idx in indices:
-                        matches.append((idx, score))
-
-        # Sort by score (descending) to return best matches first
-        matches.sort(key=lambda x: x[1], reverse=True)
-        return [idx for idx, _ in matches]
+        # Score all candidates in one call, using token_set_ratio for better matching of
+        # partial strings; results come sorted by score (descending), ties in candidate order
+        scored = process.extract(
+            normalized, candidate_names, scorer=fuzz.token_set_ratio, score_cutoff=threshold, limit=None
+        )
+        return [idx for indexed_name, _, _ in scored for idx in self._name_index[indexed_name]]
 
     def get_by_id(self, feature_id: str) -> dict[str, Any] | None:
         """
@@ -429,13 +595,13 @@ class SwissNames3DSource:
         if id_col:
             matches = self._gdf[self._gdf[id_col].astype(str) == feature_id]
             if not matches.empty:
-                return self._row_to_feature(matches.index[0])
+                return self._rows_to_features([matches.index[0]])[0]
 
         # Fallback: try as row index
         try:
             idx = int(feature_id)
             if 0 <= idx < len(self._gdf):
-                return self._row_to_feature(idx)
+                return self._rows_to_features([idx])[0]
         except ValueError:
             pass
 
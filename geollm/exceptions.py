@@ -2,6 +2,8 @@
 Custom exceptions for GeoLLM parsing and validation.
 """
 
+from collections.abc import Iterable
+
 
 class GeoFilterError(Exception):
     """Base exception for all GeoFilter errors."""
@@ -46,17 +48,26 @@ class ValidationError(GeoFilterError):
 class UnknownRelationError(ValidationError):
     """Spatial relation is not registered in configuration."""
 
-    def __init__(self, message: str, relation_name: str):
+    def __init__(self, message: str, relation_name: str, available: Iterable[str] | None = None):
         """
         Initialize unknown relation error.
 
         Args:
             message: Error description
             relation_name: The unknown relation name
+            available: Registered relation names (sorted by the caller), appended to the message
         """
         self.relation_name = relation_name
+        self.available = tuple(available) if available is not None else None
+        if self.available is not None:
+            message = f"{message}. Available relations: {', '.join(self.available)}"
         super().__init__(message, field="spatial_relation")
 
+    def __reduce__(self):
+        # args only holds the message: rebuild with the required relation_name, then restore
+        # the attributes (including available) from __dict__ without re-appending the list
+        return (type(self), (self.args[0], self.relation_name), self.__dict__)
+
 
 class LowConfidenceError(GeoFilterError):
     """Query confidence is below threshold (strict mode)."""
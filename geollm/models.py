@@ -5,6 +5,7 @@ Pydantic models for structured geographic query representation.
 from typing import Annotated, Literal
 
 from pydantic import BaseModel, Field, model_validator
+from pydantic.json_schema import SkipJsonSchema
 
 ConfidenceLevel = Annotated[float, Field(ge=0.0, le=1.0, description="Confidence score between 0 and 1")]
 
@@ -74,6 +75,14 @@ class BufferConfig(BaseModel):
         description="True if this configuration was inferred from relation defaults. "
         "False if the user explicitly specified distance or buffer parameters.",
     )
+    # Rendering resolution, not query semantics: hidden from the LLM schema
+    quad_segs: SkipJsonSchema[int] = Field(
+        8,
+        ge=1,
+        description="Segments per quarter circle used to approximate round buffer edges. "
+        "The default of 8 yields 32-vertex circles, enough for search areas; "
+        "raise it for smoother output at the cost of heavier polygons.",
+    )
 
     @model_validator(mode="after")
     def validate_ring_only(self) -> "BufferConfig":
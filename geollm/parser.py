@@ -2,10 +2,13 @@
 Main parser class for natural language geographic query parsing.
 """
 
-from typing import TYPE_CHECKING, Literal
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Literal
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import BaseMessage
+from langchain_core.prompts import ChatPromptTemplate, HumanMessagePromptTemplate
 
 from .exceptions import ParsingError
 from .models import GeoQuery
@@ -17,6 +20,18 @@ if TYPE_CHECKING:
     from .datasources.protocol import GeoDataSource
 
 
+def _unpack(response: Any) -> tuple[Any, Any, Exception | None]:
+    """
+    Split a structured-output response into (parsed, raw, parsing_error).
+
+    With include_raw=True LangChain returns a dict with those three keys;
+    otherwise the response is the parsed object itself.
+    """
+    if isinstance(response, dict):
+        return response.get("parsed"), response.get("raw", ""), response.get("parsing_error")
+    return response, "", None
+
+
 class GeoFilterParser:
     """
     Main entry point for parsing natural language location queries.
@@ -87,6 +102,16 @@ class GeoFilterParser:
         # Build prompt template
         self.prompt = self._build_prompt()
 
+        # Render the static system messages (relations, examples) once;
+        # only the final user message depends on the query
+        self._system_messages = ChatPromptTemplate.from_messages(self.prompt.messages[:-1]).format_messages()
+        user_prompt = self.prompt.messages[-1]
+        if not isinstance(user_prompt, HumanMessagePromptTemplate):
+            raise TypeError(
+                f"Expected the prompt to end with a user message template, got {type(user_prompt).__name__}"
+            )
+        self._user_prompt = user_prompt
+
     def _build_structured_llm(self):
         """Create LLM with structured output using Pydantic model."""
 
@@ -108,6 +133,10 @@ class GeoFilterParser:
             available_types=available_types,
         )
 
+    def _format_messages(self, query: str) -> list[BaseMessage]:
+        """Build the LLM input for a query from the pre-rendered system messages."""
+        return [*self._system_messages, self._user_prompt.format(query=query)]
+
     def parse(self, query: str) -> GeoQuery:
         """
         Parse a natural language location query into structured format.
@@ -163,7 +192,7 @@ class GeoFilterParser:
             'Genève'
         """
         # Format prompt with query
-        formatted_messages = self.prompt.format_messages(query=query)
+        formatted_messages = self._format_messages(query)
 
         # Invoke LLM with structured output
         try:
@@ -175,12 +204,42 @@ class GeoFilterParser:
                 original_error=e,
             ) from e
 
+        return self._process_response(query, response)
+
+    async def aparse(self, query: str) -> GeoQuery:
+        """
+        Asynchronously parse a natural language location query.
+
+        Same as parse(), but awaits the LLM call instead of blocking on it.
+
+        Args:
+            query: Natural language query in any language
+
+        Returns:
+            GeoQuery: Structured query representation with confidence scores
+
+        Raises:
+            Same exceptions as parse()
+        """
+        formatted_messages = self._format_messages(query)
+
+        try:
+            response = await self.structured_llm.ainvoke(formatted_messages)
+        except Exception as e:
+            raise ParsingError(
+                message=f"LLM invocation failed: {str(e)}",
+                raw_response="",
+                original_error=e,
+            ) from e
+
+        return self._process_response(query, response)
+
+    def _process_response(self, query: str, response: Any) -> GeoQuery:
+        """Extract the GeoQuery from a structured LLM response and run the validation pipeline."""
         # Check for parsing errors
-        parsed = response.get("parsed") if isinstance(response, dict) else response
+        parsed, raw, error = _unpack(response)
 
         if parsed is None:
-            raw = response.get("raw", "") if isinstance(response, dict) else ""
-            error = response.get("parsing_error") if isinstance(response, dict) else None
             raise ParsingError(
                 message="Failed to parse query into structured format. "
                 "LLM may have returned invalid JSON or missed required fields.",
@@ -188,8 +247,12 @@ class GeoFilterParser:
                 original_error=error,
             )
 
+        if not isinstance(parsed, GeoQuery):
+            raise ParsingError(
+                message=f"Parsed result must be GeoQuery, got {type(parsed).__name__}",
+                raw_response=str(raw),
+            )
         geo_query = parsed
-        assert isinstance(geo_query, GeoQuery), "Parsed result must be GeoQuery"
 
         # Ensure original_query is set correctly
         if not geo_query.original_query or geo_query.original_query != query:
@@ -205,15 +268,39 @@ class GeoFilterParser:
 
         return geo_query
 
-    def parse_batch(self, queries: list[str]) -> list[GeoQuery]:
+    def parse_batch(self, queries: list[str], max_workers: int = 8) -> list[GeoQuery]:
+        """
+        Parse multiple queries concurrently.
+
+        Each parse() call is dominated by the LLM network round-trip, so queries are
+        submitted from a thread pool. Wall time is roughly that of the slowest
+        requests rather than the sum of all of them.
+
+        Args:
+            queries: List of natural language queries
+            max_workers: Maximum number of concurrent LLM requests. Lower this to stay
+                         within your provider's rate limits; 1 parses sequentially.
+
+        Returns:
+            List of GeoQuery objects (same order as input)
+
+        Raises:
+            Same exceptions as parse() for any failing query
         """
-        Parse multiple queries in batch.
+        if max_workers <= 1 or len(queries) <= 1:
+            return [self.parse(query) for query in queries]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+            return list(executor.map(self.parse, queries))
 
-        Note: This is a simple sequential implementation.
-        For true parallelization, consider using async methods or ThreadPoolExecutor.
+    async def aparse_batch(self, queries: list[str], max_concurrency: int | None = None) -> list[GeoQuery]:
+        """
+        Asynchronously parse multiple queries concurrently.
 
         Args:
             queries: List of natural language queries
+            max_concurrency: Maximum number of in-flight LLM requests. None means
+                             no limit; set it to match your provider's rate limits.
 
         Returns:
             List of GeoQuery objects (same order as input)
@@ -221,7 +308,16 @@ class GeoFilterParser:
         Raises:
             Same exceptions as parse() for any failing query
         """
-        return [self.parse(query) for query in queries]
+        if max_concurrency is None:
+            return list(await asyncio.gather(*(self.aparse(query) for query in queries)))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded_parse(query: str) -> GeoQuery:
+            async with semaphore:
+                return await self.aparse(query)
+
+        return list(await asyncio.gather(*(_bounded_parse(query) for query in queries)))
 
     def get_available_relations(
         self, category: Literal["containment", "buffer", "directional"] | None = None
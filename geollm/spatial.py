@@ -3,24 +3,61 @@ Spatial operations module for transforming geometries according to spatial relat
 
 Applies buffer, directional, and containment operations to GeoJSON geometries.
 All inputs and outputs are GeoJSON dicts in WGS84 (EPSG:4326).
-Shapely is used internally for geometry operations.
+Shapely is used internally for geometry operations; callers that already hold Shapely
+geometries can pass them directly and get Shapely geometries back, skipping the
+GeoJSON round-trip.
 """
 
+import json
 import math
-from typing import Any
+from collections.abc import Callable, Sequence
+from functools import cache, lru_cache, partial
+from typing import Any, overload
 
+import numpy as np
+import shapely
 from shapely.geometry import mapping, shape
+from shapely.geometry.base import BaseGeometry
 from shapely.geometry.polygon import Polygon
 
 from .models import BufferConfig, SpatialRelation
 from .spatial_config import SpatialRelationConfig
 
+# Sector arc resolution: number of segments along the arc, and the precomputed
+# fractional positions of its _ARC_N + 1 vertices (0, 1/N, ..., 1)
+_ARC_N = 36
+_ARC_I = np.arange(_ARC_N + 1, dtype=np.float64) / _ARC_N
 
+# Geometries whose GeoJSON serialization exceeds this many characters bypass the
+# result cache, to bound its memory footprint
+_CACHE_MAX_GEOMETRY_CHARS = 100_000
+
+# Accepted geometry inputs; outputs mirror the input kind
+# (GeoJSON dict in, dict out; Shapely in, Shapely out)
+Geometry = dict[str, Any] | BaseGeometry
+
+
+@overload
 def apply_spatial_relation(
     geometry: dict[str, Any],
     relation: SpatialRelation,
     buffer_config: BufferConfig | None = None,
-) -> dict[str, Any]:
+) -> dict[str, Any]: ...
+
+
+@overload
+def apply_spatial_relation(
+    geometry: BaseGeometry,
+    relation: SpatialRelation,
+    buffer_config: BufferConfig | None = None,
+) -> BaseGeometry: ...
+
+
+def apply_spatial_relation(
+    geometry: Geometry,
+    relation: SpatialRelation,
+    buffer_config: BufferConfig | None = None,
+) -> Geometry:
     """
     Transform a reference geometry according to a spatial relation.
 
@@ -31,12 +68,13 @@ def apply_spatial_relation(
     - Directional: creates an angular sector wedge
 
     Args:
-        geometry: GeoJSON geometry dict in WGS84 (EPSG:4326).
+        geometry: GeoJSON geometry dict or Shapely geometry in WGS84 (EPSG:4326).
         relation: Spatial relation to apply.
         buffer_config: Buffer configuration (required for buffer/directional relations).
 
     Returns:
-        Transformed GeoJSON geometry dict in WGS84.
+        Transformed geometry in WGS84, of the same kind as the input
+        (GeoJSON dict or Shapely geometry).
 
     Raises:
         ValueError: If buffer_config is missing for buffer/directional relations,
@@ -57,30 +95,177 @@ def apply_spatial_relation(
         ...     relation=SpatialRelation(relation="in", category="containment"),
         ... )
     """
+    # Containment is a passthrough (the common "in X" case): no config lookup or Shapely work
     if relation.category == "containment":
-        return _apply_containment(geometry)
-    elif relation.category == "buffer":
-        if buffer_config is None:
-            raise ValueError(f"Buffer relation '{relation.relation}' requires buffer_config")
-        return _apply_buffer(geometry, buffer_config)
-    elif relation.category == "directional":
-        if buffer_config is None:
-            raise ValueError(f"Directional relation '{relation.relation}' requires buffer_config")
-        config = SpatialRelationConfig()
-        relation_config = config.get_config(relation.relation)
-        direction = relation_config.direction_angle_degrees or 0
-        sector_angle = relation_config.sector_angle_degrees or 90
-        return _apply_directional(geometry, buffer_config, direction, sector_angle)
-    else:
+        return geometry
+    if relation.category not in ("buffer", "directional"):
         raise ValueError(f"Unknown relation category: '{relation.category}'")
+    if buffer_config is None:
+        raise ValueError(f"{relation.category.capitalize()} relation '{relation.relation}' requires buffer_config")
+
+    # Shapely fast path: no GeoJSON parsing or serialization
+    if isinstance(geometry, BaseGeometry):
+        return _resolve_op(relation.relation, relation.category)(geometry, buffer_config)
+
+    # Results are memoized on the serialized inputs: repeated queries on the same
+    # reference location (e.g. "near Bern") skip the Shapely operations entirely
+    try:
+        geometry_key = json.dumps(geometry, sort_keys=True)
+    except TypeError:  # Not JSON-serializable (e.g. NumPy coordinates)
+        geometry_key = None
+    if geometry_key is None or len(geometry_key) > _CACHE_MAX_GEOMETRY_CHARS:
+        return mapping(_resolve_op(relation.relation, relation.category)(shape(geometry), buffer_config))
+
+    buffer_key = (
+        buffer_config.distance_m,
+        buffer_config.buffer_from,
+        buffer_config.ring_only,
+        buffer_config.quad_segs,
+    )
+    return mapping(_transform_cached(geometry_key, relation.relation, relation.category, buffer_key))
+
+
+@lru_cache(maxsize=64)
+def _resolve_op(relation_name: str, category: str) -> Callable[[BaseGeometry, BufferConfig], BaseGeometry]:
+    """Return the Shapely operation for a buffer or directional relation, with its parameters bound."""
+    if category == "buffer":
+        return _apply_buffer
+    direction, sector_angle = _directional_params(relation_name)
+    return partial(_apply_directional, direction_degrees=direction, sector_angle_degrees=sector_angle)
+
+
+@lru_cache(maxsize=1024)
+def _transform_cached(
+    geometry_key: str,
+    relation_name: str,
+    category: str,
+    buffer_key: tuple[float, str, bool, int],
+) -> BaseGeometry:
+    """
+    Memoized relation operation on serialized inputs.
+
+    Returns the (immutable) Shapely result; callers convert it with mapping(), so cached
+    and uncached results have the same GeoJSON structure.
+    """
+    distance_m, buffer_from, ring_only, quad_segs = buffer_key
+    buffer_config = BufferConfig.model_construct(
+        distance_m=distance_m,
+        buffer_from=buffer_from,
+        ring_only=ring_only,
+        quad_segs=quad_segs,
+    )
+    return _resolve_op(relation_name, category)(shape(json.loads(geometry_key)), buffer_config)
+
+
+@overload
+def apply_spatial_relation_batch(
+    geometries: Sequence[dict[str, Any]],
+    relations: Sequence[SpatialRelation],
+    buffer_configs: Sequence[BufferConfig | None] | None = None,
+) -> list[dict[str, Any]]: ...
+
+
+@overload
+def apply_spatial_relation_batch(
+    geometries: Sequence[BaseGeometry],
+    relations: Sequence[SpatialRelation],
+    buffer_configs: Sequence[BufferConfig | None] | None = None,
+) -> list[BaseGeometry]: ...
+
+
+def apply_spatial_relation_batch(
+    geometries: Sequence[Geometry],
+    relations: Sequence[SpatialRelation],
+    buffer_configs: Sequence[BufferConfig | None] | None = None,
+) -> list[dict[str, Any]] | list[BaseGeometry]:
+    """
+    Transform many reference geometries at once.
+
+    Equivalent to calling apply_spatial_relation() for each (geometry, relation,
+    buffer_config) triple, but centroid extraction, meter → degree conversion and
+    sector vertex generation run as single NumPy/Shapely passes over the batch.
+    Buffer operations themselves still run once per geometry.
+
+    Args:
+        geometries: GeoJSON geometry dicts or Shapely geometries in WGS84 (EPSG:4326).
+        relations: Spatial relation to apply to each geometry.
+        buffer_configs: Buffer configuration for each geometry (None entries allowed
+                        for containment relations). If omitted, all are None.
+
+    Returns:
+        Transformed geometries, in the same order and of the same kind as the input.
+
+    Raises:
+        ValueError: If the input sequences differ in length, if a buffer_config is
+                    missing for a buffer/directional relation, or if a relation
+                    category is unknown.
+    """
+    if buffer_configs is None:
+        buffer_configs = [None] * len(geometries)
+    if not len(geometries) == len(relations) == len(buffer_configs):
+        raise ValueError("geometries, relations and buffer_configs must have the same length")
+
+    results: list[Any] = list(geometries)  # Containment passthrough by default
+    buffer_items: list[tuple[int, BufferConfig]] = []
+    directional_items: list[tuple[int, BufferConfig]] = []
+
+    # Group by category
+    for i, (relation, buffer_config) in enumerate(zip(relations, buffer_configs, strict=True)):
+        if relation.category == "containment":
+            continue
+        if relation.category not in ("buffer", "directional"):
+            raise ValueError(f"Unknown relation category: '{relation.category}'")
+        if buffer_config is None:
+            raise ValueError(f"{relation.category.capitalize()} relation '{relation.relation}' requires buffer_config")
+        if relation.category == "buffer":
+            buffer_items.append((i, buffer_config))
+        else:
+            directional_items.append((i, buffer_config))
+
+    items = buffer_items + directional_items
+    if not items:
+        return results
+
+    # Bulk centroid extraction and meter → degree conversion
+    geoms = np.array([_as_shape(geometries[i]) for i, _ in items], dtype=object)
+    centroids = shapely.centroid(geoms)
+    cxs = shapely.get_x(centroids)
+    cys = shapely.get_y(centroids)
+    distances = np.array([config.distance_m for _, config in items], dtype=np.float64)
+    distances_deg = _meters_to_degrees_vec(distances, cys)
+
+    for k, (i, config) in enumerate(buffer_items):
+        results[i] = _buffer_geometry(geoms[k], float(distances_deg[k]), config)
 
+    if directional_items:
+        n_buffer = len(buffer_items)
+        units = np.stack([_unit_sector(*_directional_params(relations[i].relation)) for i, _ in directional_items])
+        centers = np.column_stack((cxs[n_buffer:], cys[n_buffer:]))
+        coords = units * distances_deg[n_buffer:, np.newaxis, np.newaxis] + centers[:, np.newaxis, :]
+        for (i, _), sector in zip(directional_items, shapely.polygons(coords), strict=True):
+            results[i] = _repair_sector(sector)
 
-def _apply_containment(geometry: dict[str, Any]) -> dict[str, Any]:
-    """Return the geometry unchanged for containment relations."""
-    return geometry
+    # Mirror the input type of each geometry
+    for i, _ in items:
+        if not isinstance(geometries[i], BaseGeometry):
+            results[i] = mapping(results[i])
 
+    return results
 
-def _apply_buffer(geometry: dict[str, Any], config: BufferConfig) -> dict[str, Any]:
+
+def _as_shape(geometry: Geometry) -> BaseGeometry:
+    """Return a Shapely geometry, parsing GeoJSON dicts."""
+    return geometry if isinstance(geometry, BaseGeometry) else shape(geometry)
+
+
+@cache
+def _directional_params(relation_name: str) -> tuple[float, float]:
+    """Return (direction, sector angle) in degrees for a built-in directional relation."""
+    relation_config = SpatialRelationConfig.default().get_config(relation_name)
+    return (relation_config.direction_angle_degrees or 0.0, relation_config.sector_angle_degrees or 90.0)
+
+
+def _apply_buffer(geom: BaseGeometry, config: BufferConfig) -> BaseGeometry:
     """
     Apply buffer operation to geometry.
 
@@ -90,38 +275,41 @@ def _apply_buffer(geometry: dict[str, Any], config: BufferConfig) -> dict[str, A
     - Ring buffer: excludes the original geometry from the buffer
     - Buffer from center vs boundary
     """
-    geom = shape(geometry)
     distance_deg = _meters_to_degrees(config.distance_m, geom.centroid.y)
+    return _buffer_geometry(geom, distance_deg, config)
+
 
+def _buffer_geometry(geom: BaseGeometry, distance_deg: float, config: BufferConfig) -> BaseGeometry:
+    """Buffer an already-parsed geometry by a distance already converted to degrees."""
     if config.buffer_from == "center":
         # Buffer from centroid
         centroid = geom.centroid
-        buffered = centroid.buffer(abs(distance_deg))
+        buffered = centroid.buffer(abs(distance_deg), quad_segs=config.quad_segs)
     else:
         # Buffer from boundary
         if config.distance_m < 0:
             # Erosion: negative buffer shrinks the polygon
-            buffered = geom.buffer(distance_deg)  # distance_deg is already negative
+            buffered = geom.buffer(distance_deg, quad_segs=config.quad_segs)  # distance_deg is already negative
         else:
             # Expansion from boundary
-            buffered = geom.buffer(distance_deg)
+            buffered = geom.buffer(distance_deg, quad_segs=config.quad_segs)
 
     # Ring buffer: subtract original geometry
     if config.ring_only and config.distance_m > 0:
         buffered = buffered.difference(geom)
 
     if buffered.is_empty:
-        return geometry  # Fallback if erosion eliminates geometry
+        return geom  # Fallback if erosion eliminates geometry
 
-    return mapping(buffered)
+    return buffered
 
 
 def _apply_directional(
-    geometry: dict[str, Any],
+    geom: BaseGeometry,
     config: BufferConfig,
     direction_degrees: float,
     sector_angle_degrees: float,
-) -> dict[str, Any]:
+) -> BaseGeometry:
     """
     Create a directional sector wedge from the geometry centroid.
 
@@ -129,45 +317,63 @@ def _apply_directional(
     Convention: 0° = North, 90° = East, 180° = South, 270° = West (clockwise).
 
     Args:
-        geometry: Reference geometry.
+        geom: Reference geometry.
         config: Buffer config (distance_m used as sector radius).
         direction_degrees: Center direction of the sector (0=N, 90=E, etc.).
         sector_angle_degrees: Total angular width of the sector.
     """
-    geom = shape(geometry)
     centroid = geom.centroid
     cx, cy = centroid.x, centroid.y
 
     radius_deg = _meters_to_degrees(config.distance_m, cy)
-    half_angle = sector_angle_degrees / 2
 
-    # Build sector as a polygon wedge
-    # Start angle and end angle (geographic: 0=N, clockwise)
-    start_angle = direction_degrees - half_angle
-    end_angle = direction_degrees + half_angle
+    # Scale and translate the unit wedge instead of recomputing the arc
+    sector = Polygon(_unit_sector(direction_degrees, sector_angle_degrees) * radius_deg + (cx, cy))
+    return _repair_sector(sector)
 
-    # Generate arc points
-    num_points = 36
-    points = [(cx, cy)]  # Center point
 
-    for i in range(num_points + 1):
-        angle = start_angle + (end_angle - start_angle) * i / num_points
-        # Convert geographic angle to math angle
-        # Geographic: 0=N, 90=E (clockwise)
-        # Math: 0=E, 90=N (counterclockwise)
-        math_angle = math.radians(90 - angle)
-        px = cx + radius_deg * math.cos(math_angle)
-        py = cy + radius_deg * math.sin(math_angle)
-        points.append((px, py))
+@cache
+def _unit_sector(direction_degrees: float, sector_angle_degrees: float) -> np.ndarray:
+    """
+    Return read-only coordinates of a unit-radius sector wedge centered at the origin.
 
-    points.append((cx, cy))  # Close the polygon
+    Sectors only differ by center and radius for a given direction and width, so the
+    arc trigonometry is done once per (direction, width) pair.
+    """
+    # Start angle and end angle (geographic: 0=N, clockwise)
+    half_angle = sector_angle_degrees / 2
+    coords = _sector_coords(0.0, 0.0, 1.0, direction_degrees - half_angle, direction_degrees + half_angle)
+    coords.flags.writeable = False
+    return coords
 
-    sector = Polygon(points)
 
+def _sector_coords(cx: float, cy: float, radius_deg: float, start_angle: float, end_angle: float) -> np.ndarray:
+    """
+    Compute closed sector wedge coordinates in one vectorized pass.
+
+    Returns an array of shape (_ARC_N + 3, 2): the center point, the arc vertices,
+    then the center again to close the ring.
+    """
+    # Convert geographic angle to math angle
+    # Geographic: 0=N, 90=E (clockwise)
+    # Math: 0=E, 90=N (counterclockwise)
+    # Wrap into [0, 360) without per-vertex branching (e.g. north: -45° → 315°)
+    angles_deg = np.mod(start_angle + (end_angle - start_angle) * _ARC_I, 360.0)
+    math_rad = np.radians(90.0 - angles_deg)
+
+    coords = np.empty((_ARC_N + 3, 2))
+    coords[0] = coords[-1] = (cx, cy)
+    coords[1:-1, 0] = cx + radius_deg * np.cos(math_rad)
+    coords[1:-1, 1] = cy + radius_deg * np.sin(math_rad)
+    return coords
+
+
+def _repair_sector(sector: BaseGeometry) -> BaseGeometry:
+    """Repair a sector polygon if it is invalid."""
     if sector.is_empty or not sector.is_valid:
         sector = sector.buffer(0)  # Fix invalid geometry
 
-    return mapping(sector)
+    return sector
 
 
 def _meters_to_degrees(meters: float, latitude: float) -> float:
@@ -187,3 +393,9 @@ def _meters_to_degrees(meters: float, latitude: float) -> float:
     # Average for a circular approximation
     avg_meters_per_degree = (meters_per_degree_lat + meters_per_degree_lon) / 2
     return meters / avg_meters_per_degree
+
+
+def _meters_to_degrees_vec(meters: np.ndarray, latitude: np.ndarray) -> np.ndarray:
+    """Vectorized variant of _meters_to_degrees over arrays of distances and latitudes."""
+    avg_meters_per_degree = 111_320 * (1 + np.cos(np.radians(latitude))) * 0.5
+    return meters / avg_meters_per_degree
@@ -2,13 +2,35 @@
 Spatial relation configuration and built-in relation definitions.
 """
 
+import threading
+from bisect import insort
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from enum import Enum
+from functools import cache
+from types import MappingProxyType
 from typing import Literal
 
 from .exceptions import UnknownRelationError
 
 
-@dataclass
+class RelationCategory(str, Enum):  # noqa: UP042 - StrEnum needs Python 3.11
+    """
+    Spatial relation category.
+
+    Members compare and hash equal to their string values, so plain strings
+    ("containment", "buffer", "directional") are accepted wherever a category is expected.
+    """
+
+    CONTAINMENT = "containment"
+    BUFFER = "buffer"
+    DIRECTIONAL = "directional"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@dataclass(slots=True, frozen=True)
 class RelationConfig:
     """
     Configuration for a single spatial relation.
@@ -26,14 +48,183 @@ class RelationConfig:
     """
 
     name: str
-    category: Literal["containment", "buffer", "directional"]
+    category: RelationCategory | Literal["containment", "buffer", "directional"]
     description: str
     default_distance_m: float | None = None
     buffer_from: Literal["center", "boundary"] | None = None
     ring_only: bool = False
     sector_angle_degrees: float | None = None
     direction_angle_degrees: float | None = None
-    applies_to: list[str] | None = None
+    applies_to: Sequence[str] | None = None  # Stored as a tuple
+
+    def __post_init__(self) -> None:
+        # Normalize plain strings to the enum (raises ValueError for unknown categories)
+        object.__setattr__(self, "category", RelationCategory(self.category))
+        if self.applies_to is not None and not isinstance(self.applies_to, tuple):
+            object.__setattr__(self, "applies_to", tuple(self.applies_to))
+
+
+# Built-in spatial relations from ARCHITECTURE.md, shared by every registry
+_BUILTIN_RELATIONS: tuple[RelationConfig, ...] = (
+    # ===== CONTAINMENT RELATIONS =====
+    RelationConfig(
+        name="in",
+        category=RelationCategory.CONTAINMENT,
+        description="Feature is within the reference boundary",
+    ),
+    # ===== BUFFER/PROXIMITY RELATIONS =====
+    RelationConfig(
+        name="near",
+        category=RelationCategory.BUFFER,
+        description="Proximity search with default 5km radius",
+        default_distance_m=5000,
+        buffer_from="center",
+    ),
+    RelationConfig(
+        name="around",
+        category=RelationCategory.BUFFER,
+        description="Similar to 'near' with 3km default radius",
+        default_distance_m=3000,
+        buffer_from="center",
+    ),
+    RelationConfig(
+        name="on_shores_of",
+        category=RelationCategory.BUFFER,
+        description="Ring buffer around lake/water boundary, excluding the water body itself",
+        default_distance_m=1000,
+        buffer_from="boundary",
+        ring_only=True,
+        applies_to=("lake", "water_body", "sea"),
+    ),
+    RelationConfig(
+        name="along",
+        category=RelationCategory.BUFFER,
+        description="Buffer following a linear feature like a river or road",
+        default_distance_m=500,
+        buffer_from="boundary",
+        applies_to=("river", "road", "railway", "linear_feature"),
+    ),
+    RelationConfig(
+        name="in_the_heart_of",
+        category=RelationCategory.BUFFER,
+        description="Central area excluding periphery (negative buffer - erosion)",
+        default_distance_m=-500,
+        buffer_from="boundary",
+    ),
+    RelationConfig(
+        name="deep_inside",
+        category=RelationCategory.BUFFER,
+        description="Well within boundaries, away from edges (strong negative buffer)",
+        default_distance_m=-1000,
+        buffer_from="boundary",
+    ),
+    # ===== DIRECTIONAL RELATIONS =====
+    # All directional relations use consistent defaults:
+    # - Distance: 10km radius (default_distance_m=10000)
+    # - Sector: 90° angular wedge (sector_angle_degrees=90)
+    # - Origin: Centroid of reference location (buffer_from="center" set in enrich_with_defaults)
+    # These defaults are applied automatically by enrich_with_defaults() for any directional query.
+    # Convention: 0° = North, angles increase clockwise (90° = East, 180° = South, 270° = West)
+    RelationConfig(
+        name="north_of",
+        category=RelationCategory.DIRECTIONAL,
+        description="Directional sector north of reference",
+        default_distance_m=10000,
+        sector_angle_degrees=90,
+        direction_angle_degrees=0,
+    ),
+    RelationConfig(
+        name="south_of",
+        category=RelationCategory.DIRECTIONAL,
+        description="Directional sector south of reference",
+        default_distance_m=10000,
+        sector_angle_degrees=90,
+        direction_angle_degrees=180,
+    ),
+    RelationConfig(
+        name="east_of",
+        category=RelationCategory.DIRECTIONAL,
+        description="Directional sector east of reference",
+        default_distance_m=10000,
+        sector_angle_degrees=90,
+        direction_angle_degrees=90,
+    ),
+    RelationConfig(
+        name="west_of",
+        category=RelationCategory.DIRECTIONAL,
+        description="Directional sector west of reference",
+        default_distance_m=10000,
+        sector_angle_degrees=90,
+        direction_angle_degrees=270,
+    ),
+    # ===== DIAGONAL DIRECTIONAL RELATIONS =====
+    RelationConfig(
+        name="northeast_of",
+        category=RelationCategory.DIRECTIONAL,
+        description="Directional sector northeast of reference",
+        default_distance_m=10000,
+        sector_angle_degrees=90,
+        direction_angle_degrees=45,
+    ),
+    RelationConfig(
+        name="southeast_of",
+        category=RelationCategory.DIRECTIONAL,
+        description="Directional sector southeast of reference",
+        default_distance_m=10000,
+        sector_angle_degrees=90,
+        direction_angle_degrees=135,
+    ),
+    RelationConfig(
+        name="southwest_of",
+        category=RelationCategory.DIRECTIONAL,
+        description="Directional sector southwest of reference",
+        default_distance_m=10000,
+        sector_angle_degrees=90,
+        direction_angle_degrees=225,
+    ),
+    RelationConfig(
+        name="northwest_of",
+        category=RelationCategory.DIRECTIONAL,
+        description="Directional sector northwest of reference",
+        default_distance_m=10000,
+        sector_angle_degrees=90,
+        direction_angle_degrees=315,
+    ),
+)
+
+
+_PROMPT_NOTES = """
+NOTES:
+  • Negative distances indicate erosion/shrinking (e.g., in_the_heart_of)
+  • Ring buffers exclude the reference feature itself (e.g., shores of lake)
+  • Buffer from 'center' vs 'boundary' determines buffer origin"""
+
+
+def _render_relation(rel: RelationConfig) -> str:
+    """Render the format_for_prompt entry of a single relation."""
+    # Build distance info
+    dist_info = ""
+    if rel.default_distance_m is not None:
+        dist_str = f"{abs(rel.default_distance_m)}m"
+        if rel.default_distance_m < 0:
+            dist_info = f" (default: {dist_str} erosion)"
+        else:
+            dist_info = f" (default: {dist_str})"
+
+    # Build special flags
+    flags = []
+    if rel.ring_only:
+        flags.append("ring buffer")
+    if rel.buffer_from:
+        flags.append(f"from {rel.buffer_from}")
+    flag_info = f" [{', '.join(flags)}]" if flags else ""
+
+    entry = f"  • {rel.name}{dist_info}{flag_info}\n    {rel.description}"
+
+    # Add applies_to info
+    if rel.applies_to:
+        entry += f"\n    (commonly used with: {', '.join(rel.applies_to)})"
+    return entry
 
 
 class SpatialRelationConfig:
@@ -43,248 +234,116 @@ class SpatialRelationConfig:
     Manages built-in and custom spatial relations with their default parameters.
     """
 
+    __slots__ = ("_relations", "_sorted_names", "_sorted_by_category", "_rendered", "_prompt_cache", "_init_lock")
+
     def __init__(self):
-        """Initialize with built-in spatial relations."""
-        self.relations: dict[str, RelationConfig] = {}
-        self._initialize_defaults()
+        """Initialize the registry; built-in relations are registered on first use."""
+        self._relations: dict[str, RelationConfig] | None = None
+        # Relation names kept sorted as they are registered, overall and per category
+        self._sorted_names: list[str] = []
+        self._sorted_by_category: dict[RelationCategory, list[str]] = {}
+        self._rendered: dict[str, str] = {}  # Prompt entry of each relation, rendered at registration
+        self._prompt_cache: str | None = None  # Cached format_for_prompt() output
+        self._init_lock = threading.Lock()
+
+    @property
+    def relations(self) -> Mapping[str, RelationConfig]:
+        """Read-only view of the registered relations by name, including the built-ins."""
+        # Writes must go through register_relation to keep the sorted names and prompt in sync
+        return MappingProxyType(self._ensure_initialized())
+
+    def _ensure_initialized(self) -> dict[str, RelationConfig]:
+        """Register the built-in relations on first use (thread-safe)."""
+        relations = self._relations
+        if relations is None:
+            with self._init_lock:
+                if self._relations is None:
+                    self._initialize_defaults()
+                relations = self._relations
+                assert relations is not None
+        return relations
+
+    @classmethod
+    def default(cls) -> "SpatialRelationConfig":
+        """
+        Return the shared registry of built-in relations.
+
+        The instance is created once per process. Treat it as read-only: to add
+        custom relations, create a separate SpatialRelationConfig() instead.
+        """
+        return _default_config()
 
     def _initialize_defaults(self):
         """Register built-in spatial relations from ARCHITECTURE.md."""
-
-        # ===== CONTAINMENT RELATIONS =====
-        self.register_relation(
-            RelationConfig(
-                name="in",
-                category="containment",
-                description="Feature is within the reference boundary",
-            )
-        )
-
-        # ===== BUFFER/PROXIMITY RELATIONS =====
-        self.register_relation(
-            RelationConfig(
-                name="near",
-                category="buffer",
-                description="Proximity search with default 5km radius",
-                default_distance_m=5000,
-                buffer_from="center",
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="around",
-                category="buffer",
-                description="Similar to 'near' with 3km default radius",
-                default_distance_m=3000,
-                buffer_from="center",
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="on_shores_of",
-                category="buffer",
-                description="Ring buffer around lake/water boundary, excluding the water body itself",
-                default_distance_m=1000,
-                buffer_from="boundary",
-                ring_only=True,
-                applies_to=["lake", "water_body", "sea"],
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="along",
-                category="buffer",
-                description="Buffer following a linear feature like a river or road",
-                default_distance_m=500,
-                buffer_from="boundary",
-                applies_to=["river", "road", "railway", "linear_feature"],
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="in_the_heart_of",
-                category="buffer",
-                description="Central area excluding periphery (negative buffer - erosion)",
-                default_distance_m=-500,
-                buffer_from="boundary",
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="deep_inside",
-                category="buffer",
-                description="Well within boundaries, away from edges (strong negative buffer)",
-                default_distance_m=-1000,
-                buffer_from="boundary",
-            )
-        )
-
-        # ===== DIRECTIONAL RELATIONS =====
-        # All directional relations use consistent defaults:
-        # - Distance: 10km radius (default_distance_m=10000)
-        # - Sector: 90° angular wedge (sector_angle_degrees=90)
-        # - Origin: Centroid of reference location (buffer_from="center" set in enrich_with_defaults)
-        # These defaults are applied automatically by enrich_with_defaults() for any directional query.
-        # Convention: 0° = North, angles increase clockwise (90° = East, 180° = South, 270° = West)
-        self.register_relation(
-            RelationConfig(
-                name="north_of",
-                category="directional",
-                description="Directional sector north of reference",
-                default_distance_m=10000,
-                sector_angle_degrees=90,
-                direction_angle_degrees=0,
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="south_of",
-                category="directional",
-                description="Directional sector south of reference",
-                default_distance_m=10000,
-                sector_angle_degrees=90,
-                direction_angle_degrees=180,
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="east_of",
-                category="directional",
-                description="Directional sector east of reference",
-                default_distance_m=10000,
-                sector_angle_degrees=90,
-                direction_angle_degrees=90,
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="west_of",
-                category="directional",
-                description="Directional sector west of reference",
-                default_distance_m=10000,
-                sector_angle_degrees=90,
-                direction_angle_degrees=270,
-            )
-        )
-
-        # ===== DIAGONAL DIRECTIONAL RELATIONS =====
-        self.register_relation(
-            RelationConfig(
-                name="northeast_of",
-                category="directional",
-                description="Directional sector northeast of reference",
-                default_distance_m=10000,
-                sector_angle_degrees=90,
-                direction_angle_degrees=45,
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="southeast_of",
-                category="directional",
-                description="Directional sector southeast of reference",
-                default_distance_m=10000,
-                sector_angle_degrees=90,
-                direction_angle_degrees=135,
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="southwest_of",
-                category="directional",
-                description="Directional sector southwest of reference",
-                default_distance_m=10000,
-                sector_angle_degrees=90,
-                direction_angle_degrees=225,
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="northwest_of",
-                category="directional",
-                description="Directional sector northwest of reference",
-                default_distance_m=10000,
-                sector_angle_degrees=90,
-                direction_angle_degrees=315,
-            )
-        )
+        relations: dict[str, RelationConfig] = {}
+        for config in _BUILTIN_RELATIONS:
+            self._add_relation(relations, config)
+        # Publish only the complete registry, so that concurrent readers never see a partial one
+        self._relations = relations
 
     def register_relation(self, config: RelationConfig) -> None:
         """Register a new spatial relation."""
-        self.relations[config.name] = config
+        self._add_relation(self._ensure_initialized(), config)
+
+    def _add_relation(self, relations: dict[str, RelationConfig], config: RelationConfig) -> None:
+        """Add a relation to the registry dict and the derived sorted/rendered lookups."""
+        previous = relations.get(config.name)
+        category = RelationCategory(config.category)
+        if previous is None:
+            insort(self._sorted_names, config.name)
+        elif previous.category != category:
+            # Re-registration under another category: move the name across
+            self._sorted_by_category[RelationCategory(previous.category)].remove(config.name)
+        if previous is None or previous.category != category:
+            insort(self._sorted_by_category.setdefault(category, []), config.name)
+        relations[config.name] = config
+        self._rendered[config.name] = _render_relation(config)
+        self._prompt_cache = None
 
     def has_relation(self, name: str) -> bool:
         """Check if a relation is registered."""
-        return name in self.relations
+        return name in self._ensure_initialized()
 
     def get_config(self, name: str) -> RelationConfig:
         """Get configuration for a relation. Raises UnknownRelationError if not found."""
-        if not self.has_relation(name):
+        config = self._ensure_initialized().get(name)
+        if config is None:
             raise UnknownRelationError(
-                f"Unknown spatial relation: '{name}'. Available relations: {', '.join(sorted(self.relations.keys()))}",
+                f"Unknown spatial relation: '{name}'",
                 relation_name=name,
+                available=tuple(self._sorted_names),
             )
-        return self.relations[name]
+        return config
 
-    def list_relations(self, category: Literal["containment", "buffer", "directional"] | None = None) -> list[str]:
-        """List available relation names."""
+    def list_relations(
+        self, category: RelationCategory | Literal["containment", "buffer", "directional"] | None = None
+    ) -> list[str]:
+        """List available relation names, sorted."""
+        self._ensure_initialized()
         if category is None:
-            return sorted(self.relations.keys())
-        return sorted(r.name for r in self.relations.values() if r.category == category)
+            return list(self._sorted_names)
+        return list(self._sorted_by_category.get(category, ()))
 
     def format_for_prompt(self) -> str:
-        """Format relations for inclusion in LLM prompt."""
-        lines = []
+        """Format relations for inclusion in LLM prompt (cached until the next registration)."""
+        if self._prompt_cache is not None:
+            return self._prompt_cache
 
-        # Group by category
-        for category in ["containment", "buffer", "directional"]:
-            category_relations = [r for r in self.relations.values() if r.category == category]
-            if not category_relations:
+        self._ensure_initialized()
+        lines = []
+        for category in RelationCategory:
+            names = self._sorted_by_category.get(category)
+            if not names:
                 continue
-
             lines.append(f"\n{category.upper()} RELATIONS:")
+            lines.extend(self._rendered[name] for name in names)
+        lines.append(_PROMPT_NOTES)
+
+        self._prompt_cache = "\n".join(lines)
+        return self._prompt_cache
+
 
-            for rel in sorted(category_relations, key=lambda r: r.name):
-                # Build distance info
-                dist_info = ""
-                if rel.default_distance_m is not None:
-                    dist_str = f"{abs(rel.default_distance_m)}m"
-                    if rel.default_distance_m < 0:
-                        dist_info = f" (default: {dist_str} erosion)"
-                    else:
-                        dist_info = f" (default: {dist_str})"
-
-                # Build special flags
-                flags = []
-                if rel.ring_only:
-                    flags.append("ring buffer")
-                if rel.buffer_from:
-                    flags.append(f"from {rel.buffer_from}")
-                flag_info = f" [{', '.join(flags)}]" if flags else ""
-
-                # Format line
-                lines.append(f"  • {rel.name}{dist_info}{flag_info}")
-                lines.append(f"    {rel.description}")
-
-                # Add applies_to info
-                if rel.applies_to:
-                    lines.append(f"    (commonly used with: {', '.join(rel.applies_to)})")
-
-        # Add notes
-        lines.append("\nNOTES:")
-        lines.append("  • Negative distances indicate erosion/shrinking (e.g., in_the_heart_of)")
-        lines.append("  • Ring buffers exclude the reference feature itself (e.g., shores of lake)")
-        lines.append("  • Buffer from 'center' vs 'boundary' determines buffer origin")
-
-        return "\n".join(lines)
+@cache
+def _default_config() -> SpatialRelationConfig:
+    """Build the shared built-in registry returned by SpatialRelationConfig.default()."""
+    return SpatialRelationConfig()
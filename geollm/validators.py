@@ -23,11 +23,10 @@ def validate_spatial_relation(geo_query: GeoQuery, spatial_config: SpatialRelati
     relation_name = geo_query.spatial_relation.relation
 
     if not spatial_config.has_relation(relation_name):
-        available = ", ".join(sorted(spatial_config.list_relations()))
         raise UnknownRelationError(
-            f"Unknown spatial relation: '{relation_name}'. "
-            f"This may be an LLM hallucination. Available relations: {available}",
+            f"Unknown spatial relation: '{relation_name}'. This may be an LLM hallucination",
             relation_name=relation_name,
+            available=spatial_config.list_relations(),
         )
 
 
@@ -3,46 +3,112 @@ Interactive REPL for GeoLLM query parsing.
 """
 
 import os
+import sys
 
 from dotenv import load_dotenv
 from langchain.chat_models import init_chat_model
 
 from geollm import GeoFilterParser
 
+# Layout of print_result; optional blocks are filled in (or left empty) per result
+_RESULT_TEMPLATE = """
+{rule}
+RESULT
+{rule}
+
+📍 Location: {location}
+   Type: {type}
+
+🔗 Spatial Relation: {relation} ({category})
+{buffer_block}
+📊 Confidence Scores:
+   Overall: {overall:.2f}
+   Location: {location_confidence:.2f}
+{relation_confidence_block}
+"""
+
 
 def print_result(result):
     """Pretty print the parsed query result."""
-    print()
-    print("=" * 60)
-    print("RESULT")
-    print("=" * 60)
-
-    # Reference location
-    print(f"\n📍 Location: {result.reference_location.name}")
-    if result.reference_location.type:
-        type_str = result.reference_location.type
-        if result.reference_location.type_confidence is not None:
-            type_str += f" (confidence: {result.reference_location.type_confidence:.2f})"
-        print(f"   Type: {type_str}")
-    else:
-        print("   Type: (not specified)")
+    location = result.reference_location
+    confidence = result.confidence_breakdown
 
-    # Spatial relation
-    print(f"\n🔗 Spatial Relation: {result.spatial_relation.relation} ({result.spatial_relation.category})")
+    type_str = "(not specified)"
+    if location.type:
+        type_str = location.type
+        if location.type_confidence is not None:
+            type_str += f" (confidence: {location.type_confidence:.2f})"
 
-    # Buffer config (if any)
+    buffer_block = ""
     if result.buffer_config:
-        print(f"\n📏 Buffer Distance: {result.buffer_config.distance_m}m")
-        print(f"   From: {result.buffer_config.buffer_from}")
+        buffer_block = (
+            f"\n📏 Buffer Distance: {result.buffer_config.distance_m}m\n   From: {result.buffer_config.buffer_from}\n"
+        )
+
+    relation_confidence_block = ""
+    if confidence.relation_confidence:
+        relation_confidence_block = f"   Relation: {confidence.relation_confidence:.2f}\n"
+
+    # Assemble the whole report and write it at once
+    sys.stdout.write(
+        _RESULT_TEMPLATE.format_map(
+            {
+                "rule": "=" * 60,
+                "location": location.name,
+                "type": type_str,
+                "relation": result.spatial_relation.relation,
+                "category": result.spatial_relation.category,
+                "buffer_block": buffer_block,
+                "overall": confidence.overall,
+                "location_confidence": confidence.location_confidence,
+                "relation_confidence_block": relation_confidence_block,
+            }
+        )
+    )
+
+
+def _cmd_quit(_parser) -> bool:
+    """Exit the REPL."""
+    print("👋 Goodbye!")
+    return True
 
-    # Confidence breakdown
-    print("\n📊 Confidence Scores:")
-    print(f"   Overall: {result.confidence_breakdown.overall:.2f}")
-    print(f"   Location: {result.confidence_breakdown.location_confidence:.2f}")
-    if result.confidence_breakdown.relation_confidence:
-        print(f"   Relation: {result.confidence_breakdown.relation_confidence:.2f}")
 
+def _cmd_help(_parser) -> bool:
+    """Show the available commands and example queries."""
     print()
+    print("Available commands:")
+    print("  help    - Show this help message")
+    print("  quit    - Exit the REPL")
+    print("  relations - List available spatial relations")
+    print()
+    print("Example queries:")
+    print("  - 'in Bern'")
+    print("  - 'near Lake Geneva'")
+    print("  - 'north of Zurich'")
+    print("  - 'Bushaltestellen in Zürich' (German)")
+    print()
+    return False
+
+
+def _cmd_relations(parser) -> bool:
+    """List the available spatial relations by category."""
+    print()
+    print("Available Spatial Relations:")
+    print("=" * 60)
+    print("Containment:", ", ".join(parser.get_available_relations("containment")))
+    print("Buffer:", ", ".join(parser.get_available_relations("buffer")))
+    print("Directional:", ", ".join(parser.get_available_relations("directional")))
+    print()
+    return False
+
+
+# REPL commands (matched case-insensitively); a handler returns True to exit
+_COMMANDS = {
+    "quit": _cmd_quit,
+    "exit": _cmd_quit,
+    "help": _cmd_help,
+    "relations": _cmd_relations,
+}
 
 
 def main():
@@ -95,33 +161,10 @@ def main():
                 continue
 
             # Handle special commands
-            if query.lower() == "quit" or query.lower() == "exit":
-                print("👋 Goodbye!")
-                break
-
-            if query.lower() == "help":
-                print()
-                print("Available commands:")
-                print("  help    - Show this help message")
-                print("  quit    - Exit the REPL")
-                print("  relations - List available spatial relations")
-                print()
-                print("Example queries:")
-                print("  - 'in Bern'")
-                print("  - 'near Lake Geneva'")
-                print("  - 'north of Zurich'")
-                print("  - 'Bushaltestellen in Zürich' (German)")
-                print()
-                continue
-
-            if query.lower() == "relations":
-                print()
-                print("Available Spatial Relations:")
-                print("=" * 60)
-                print("Containment:", ", ".join(parser.get_available_relations("containment")))
-                print("Buffer:", ", ".join(parser.get_available_relations("buffer")))
-                print("Directional:", ", ".join(parser.get_available_relations("directional")))
-                print()
+            handler = _COMMANDS.get(query.lower())
+            if handler is not None:
+                if handler(parser):
+                    break
                 continue
 
             # Parse the query
@@ -0,0 +1,25 @@
+"""
+Shared pytest configuration.
+"""
+
+from pathlib import Path
+
+import pytest
+
+# Real SwissNames3D shapefiles directory (see tests/test_swissnames3d.py)
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def pytest_collection_modifyitems(items):
+    """
+    Skip tests that need the real SwissNames3D data at collection time when it is absent.
+
+    A test module lists its fixtures that read DATA_DIR in a REAL_DATA_FIXTURES set.
+    """
+    if DATA_DIR.exists():
+        return
+    skip_real = pytest.mark.skip(reason="Real SwissNames3D data directory not found")
+    for item in items:
+        real_data_fixtures = getattr(getattr(item, "module", None), "REAL_DATA_FIXTURES", frozenset())
+        if real_data_fixtures.intersection(getattr(item, "fixturenames", ())):
+            item.add_marker(skip_real)
@@ -0,0 +1,35 @@
+"""
+Tests for custom exceptions.
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from geollm.exceptions import ParsingError, UnknownRelationError, ValidationError
+
+
+@pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, lambda e: pickle.loads(pickle.dumps(e))])
+def test_exception_attributes_survive_copy_and_pickle(clone):
+    """Test that copies and pickle round-trips keep the exception attributes."""
+    parsing = clone(ParsingError("boom", raw_response="RAW"))
+    assert str(parsing) == "boom"
+    assert parsing.raw_response == "RAW"
+
+    validation = clone(ValidationError("bad", field="buffer_config", detail="negative"))
+    assert (validation.field, validation.detail) == ("buffer_config", "negative")
+
+
+@pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, lambda e: pickle.loads(pickle.dumps(e))])
+def test_unknown_relation_error_survives_copy_and_pickle(clone):
+    """Test that the relation list stays in the message and attributes of copies."""
+    error = UnknownRelationError("Unknown spatial relation: 'beside'", relation_name="beside", available=["in", "near"])
+    assert error.args == ("Unknown spatial relation: 'beside'. Available relations: in, near",)
+
+    cloned = clone(error)
+    assert str(cloned) == str(error)
+    assert repr(cloned) == repr(error)
+    assert cloned.relation_name == "beside"
+    assert cloned.available == ("in", "near")
+    assert cloned.field == "spatial_relation"
@@ -0,0 +1,61 @@
+"""
+Tests for the location type hierarchy.
+"""
+
+from geollm.datasources.location_types import TYPE_HIERARCHY, get_matching_types, normalize_type, prefix_match
+
+
+def test_matching_types_concrete():
+    """Test that a concrete type matches only itself."""
+    assert get_matching_types("lake") == ["lake"]
+
+
+def test_matching_types_category():
+    """Test that a category matches all of its concrete types."""
+    assert get_matching_types("water") == list(TYPE_HIERARCHY["water"])
+
+
+def test_matching_types_category_takes_precedence():
+    """Test that a name that is both a category and a concrete type resolves to the category."""
+    assert get_matching_types("island") == ["island", "peninsula"]
+
+
+def test_matching_types_normalizes_input():
+    """Test case and whitespace insensitivity."""
+    assert get_matching_types("  Lake ") == ["lake"]
+
+
+def test_matching_types_unknown():
+    """Test that unknown types match nothing."""
+    assert get_matching_types("atlantis") == []
+
+
+def test_matching_types_returns_copy():
+    """Test that mutating the result does not affect the hierarchy."""
+    result = get_matching_types("water")
+    result.append("ocean")
+    assert "ocean" not in get_matching_types("water")
+
+
+def test_prefix_match():
+    """Test prefix matching over types and categories."""
+    assert prefix_match("lak") == ["lake"]
+    assert prefix_match("rail") == ["railway", "railway_area"]
+    assert prefix_match("xyz") == []
+
+
+def test_prefixes_are_not_expanded():
+    """Test that normalize_type and get_matching_types only accept exact names."""
+    assert normalize_type("Riv") == "riv"
+    assert normalize_type("z") == "z"  # Not "zoo"
+    assert get_matching_types("lak") == []
+    assert get_matching_types("hosp") == []
+
+
+def test_normalize_type_allow_prefix():
+    """Test that allow_prefix resolves unambiguous prefixes only."""
+    assert normalize_type("Hospit", allow_prefix=True) == "hospital"
+    assert normalize_type("lak", allow_prefix=True) == "lake"
+    assert normalize_type("rail", allow_prefix=True) == "rail"  # railway or railway_area
+    assert normalize_type("lake", allow_prefix=True) == "lake"
+    assert normalize_type("xyz", allow_prefix=True) == "xyz"
@@ -0,0 +1,205 @@
+"""
+Tests for GeoFilterParser, using a stub chat model instead of a real LLM.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableLambda
+from pydantic import Field
+
+from geollm import GeoFilterParser
+from geollm.exceptions import ParsingError
+from geollm.models import ConfidenceScore, GeoQuery, ReferenceLocation, SpatialRelation
+
+
+def _query_of(messages: list[BaseMessage]) -> str:
+    """Extract the user query from the formatted prompt messages."""
+    content = str(messages[-1].content)
+    return content.split("Query: ", 1)[1].split("\n", 1)[0]
+
+
+class _ConcurrencyProbe:
+    """Context manager counting the calls in flight, and the peak reached."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def __exit__(self, *exc_info):
+        with self._lock:
+            self.active -= 1
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model stub whose structured output is computed from the query by `respond`."""
+
+    respond: Callable[[str], Any]
+    delay: float = 0.0  # Simulated LLM latency, in seconds
+    probe: _ConcurrencyProbe = Field(default_factory=_ConcurrencyProbe)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        raise NotImplementedError("FakeChatModel only supports structured output")
+
+    def with_structured_output(self, schema, *, include_raw=False, **_kwargs):
+        # The parser relies on the {"parsed", "raw", "parsing_error"} response layout
+        assert schema is GeoQuery and include_raw
+
+        def invoke(messages: list[BaseMessage]) -> Any:
+            with self.probe:
+                time.sleep(self.delay)
+            return self.respond(_query_of(messages))
+
+        async def ainvoke(messages: list[BaseMessage]) -> Any:
+            with self.probe:
+                await asyncio.sleep(self.delay)
+            return self.respond(_query_of(messages))
+
+        return RunnableLambda(invoke, afunc=ainvoke)
+
+
+def _geo_query(query: str) -> GeoQuery:
+    """A confident containment query on the location named by the query text."""
+    return GeoQuery(
+        query_type="simple",
+        spatial_relation=SpatialRelation(relation="in", category="containment"),
+        reference_location=ReferenceLocation(name=query, type="city"),
+        buffer_config=None,
+        confidence_breakdown=ConfidenceScore(overall=0.9, location_confidence=0.9, relation_confidence=0.9),
+        original_query=query,
+    )
+
+
+def _respond(query: str) -> dict[str, Any]:
+    """Successful structured-output response, as returned with include_raw=True."""
+    if query == "fail":
+        return {"parsed": None, "raw": "not json", "parsing_error": ValueError("bad output")}
+    return {"parsed": _geo_query(query), "raw": f"raw {query}", "parsing_error": None}
+
+
+def _make_parser(respond: Callable[[str], Any] = _respond) -> GeoFilterParser:
+    """Create a parser over a FakeChatModel."""
+    return GeoFilterParser(llm=FakeChatModel(respond=respond))
+
+
+@pytest.fixture
+def parser():
+    """Parser over a stub model answering every query (except "fail") with a valid GeoQuery."""
+    return _make_parser()
+
+
+def test_format_messages_matches_prompt(parser):
+    """Test that the pre-rendered system messages give the same input as formatting the full prompt."""
+    query = "restaurants {near} Lausanne"
+    assert parser._format_messages(query) == parser.prompt.format_messages(query=query)
+
+
+def test_parse(parser):
+    """Test that a structured response is validated and returned."""
+    result = parser.parse("Bern")
+    assert result.reference_location.name == "Bern"
+    assert result.original_query == "Bern"
+
+
+def test_parse_unwrapped_response():
+    """Test that a response without the include_raw wrapper is accepted."""
+    result = _make_parser(respond=_geo_query).parse("Bern")
+    assert result.reference_location.name == "Bern"
+
+
+def test_parse_failed_structured_output(parser):
+    """Test that a response without a parsed object raises ParsingError with the raw output."""
+    with pytest.raises(ParsingError) as exc_info:
+        parser.parse("fail")
+
+    assert exc_info.value.raw_response == "not json"
+    assert isinstance(exc_info.value.original_error, ValueError)
+
+
+def test_parse_wrong_parsed_type():
+    """Test that a parsed object that is not a GeoQuery raises ParsingError."""
+    parser = _make_parser(respond=lambda query: {"parsed": {"query": query}, "raw": "raw", "parsing_error": None})
+
+    with pytest.raises(ParsingError, match="must be GeoQuery, got dict"):
+        parser.parse("Bern")
+
+
+def test_parse_llm_failure():
+    """Test that an exception from the LLM call is wrapped in ParsingError."""
+
+    def respond(_query: str) -> Any:
+        raise RuntimeError("rate limited")
+
+    with pytest.raises(ParsingError, match="rate limited") as exc_info:
+        _make_parser(respond=respond).parse("Bern")
+
+    assert isinstance(exc_info.value.original_error, RuntimeError)
+
+
+def test_aparse(parser):
+    """Test that aparse returns the same result as parse."""
+    assert asyncio.run(parser.aparse("Bern")) == parser.parse("Bern")
+
+
+def test_parse_batch_preserves_order():
+    """Test that batch results follow the input order, whatever the completion order."""
+    queries = [f"place {i}" for i in range(6)]
+
+    def respond(query: str) -> dict[str, Any]:
+        time.sleep(0.005 * (6 - int(query.split()[1])))  # Later queries finish first
+        return _respond(query)
+
+    results = _make_parser(respond=respond).parse_batch(queries, max_workers=6)
+    assert [r.original_query for r in results] == queries
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_parse_batch_max_workers(max_workers):
+    """Test that parse_batch never runs more LLM calls at once than max_workers."""
+    llm = FakeChatModel(respond=_respond, delay=0.01)
+    queries = [f"place {i}" for i in range(8)]
+
+    results = GeoFilterParser(llm=llm).parse_batch(queries, max_workers=max_workers)
+
+    assert [r.original_query for r in results] == queries
+    assert llm.probe.peak <= max_workers
+
+
+@pytest.mark.parametrize("max_concurrency", [None, 2])
+def test_aparse_batch_max_concurrency(max_concurrency):
+    """Test that aparse_batch keeps the input order and bounds the calls in flight."""
+    llm = FakeChatModel(respond=_respond, delay=0.01)
+    queries = [f"place {i}" for i in range(8)]
+
+    results = asyncio.run(GeoFilterParser(llm=llm).aparse_batch(queries, max_concurrency=max_concurrency))
+
+    assert [r.original_query for r in results] == queries
+    assert llm.probe.peak == (max_concurrency or len(queries))
+
+
+def test_batch_propagates_parsing_error(parser):
+    """Test that a failing query makes the whole batch raise ParsingError."""
+    queries = ["Bern", "fail", "Zurich"]
+
+    with pytest.raises(ParsingError):
+        parser.parse_batch(queries)
+    with pytest.raises(ParsingError):
+        asyncio.run(parser.aparse_batch(queries))
+    with pytest.raises(ParsingError):
+        asyncio.run(parser.aparse_batch(queries, max_concurrency=1))
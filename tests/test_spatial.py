@@ -2,10 +2,12 @@
 Tests for spatial operations module.
 """
 
+import pytest
 from shapely.geometry import Point, Polygon, mapping, shape
 
+from geollm import spatial
 from geollm.models import BufferConfig, SpatialRelation
-from geollm.spatial import apply_spatial_relation
+from geollm.spatial import apply_spatial_relation, apply_spatial_relation_batch
 
 
 def test_containment_passthrough():
@@ -80,7 +82,7 @@ def test_directional_sector():
 
     # Mocking the spatial config lookup inside apply_spatial_relation requires mocking
     # SpatialRelationConfig. Or we can rely on defaults if we didn't mock it?
-    # The implementation instantiates SpatialRelationConfig() internally.
+    # The implementation uses the shared SpatialRelationConfig.default() registry.
     # "north_of" is a built-in relation, so it should work.
 
     result = apply_spatial_relation(geom, relation, config)
@@ -89,3 +91,108 @@ def test_directional_sector():
     assert poly.contains(Point(0, 0.5))  # Point to North should be inside
     assert not poly.contains(Point(0, -0.5))  # Point to South should be outside
     assert not poly.contains(Point(0.5, 0))  # Point to East should be outside (45 deg boundary)
+
+
+def test_batch_matches_single():
+    """Test that batch results match per-geometry results, in input order."""
+    point = {"type": "Point", "coordinates": [6.63, 46.52]}
+    square = mapping(Polygon([(7.0, 46.0), (7.2, 46.0), (7.2, 46.2), (7.0, 46.2)]))
+    geometries = [point, square, point, square, point]
+    relations = [
+        SpatialRelation(relation="north_of", category="directional"),
+        SpatialRelation(relation="in", category="containment"),
+        SpatialRelation(relation="near", category="buffer"),
+        SpatialRelation(relation="on_shores_of", category="buffer"),
+        SpatialRelation(relation="southwest_of", category="directional"),
+    ]
+    configs = [
+        BufferConfig(distance_m=10000, buffer_from="center"),
+        None,
+        BufferConfig(distance_m=5000, buffer_from="center"),
+        BufferConfig(distance_m=1000, buffer_from="boundary", ring_only=True),
+        BufferConfig(distance_m=20000, buffer_from="center"),
+    ]
+
+    results = apply_spatial_relation_batch(geometries, relations, configs)
+
+    assert len(results) == len(geometries)
+    assert results[1] == square
+    for geometry, relation, config, result in zip(geometries, relations, configs, results, strict=True):
+        expected = shape(apply_spatial_relation(geometry, relation, config))
+        assert shape(result).equals_exact(expected, 1e-9)
+
+
+def test_batch_empty():
+    """Test that an empty batch returns an empty list."""
+    assert apply_spatial_relation_batch([], []) == []
+
+
+def test_batch_length_mismatch():
+    """Test that mismatched input lengths are rejected."""
+    geom = {"type": "Point", "coordinates": [0, 0]}
+    with pytest.raises(ValueError, match="same length"):
+        apply_spatial_relation_batch([geom, geom], [SpatialRelation(relation="in", category="containment")])
+
+
+def test_batch_missing_buffer_config():
+    """Test that buffer relations without buffer_config are rejected."""
+    geom = {"type": "Point", "coordinates": [0, 0]}
+    relation = SpatialRelation(relation="near", category="buffer")
+    with pytest.raises(ValueError, match="requires buffer_config"):
+        apply_spatial_relation_batch([geom], [relation], [None])
+
+
+def test_repeated_calls_return_independent_results():
+    """Test that memoized results are equal across calls but safe to mutate."""
+    geom = {"type": "Point", "coordinates": [7.44, 46.95]}
+    relation = SpatialRelation(relation="near", category="buffer")
+    config = BufferConfig(distance_m=5000, buffer_from="center")
+
+    first = apply_spatial_relation(geom, relation, config)
+    first["type"] = "Mutated"
+    second = apply_spatial_relation(geom, relation, config)
+
+    assert second["type"] == "Polygon"
+    assert shape(second).contains(Point(7.44, 46.95))
+
+
+def test_shapely_input_returns_shapely():
+    """Test that Shapely geometries are accepted and returned without GeoJSON conversion."""
+    point = Point(7.44, 46.95)
+    relation = SpatialRelation(relation="near", category="buffer")
+    config = BufferConfig(distance_m=5000, buffer_from="center")
+
+    result = apply_spatial_relation(point, relation, config)
+
+    assert isinstance(result, Polygon)
+    assert result.equals_exact(shape(apply_spatial_relation(mapping(point), relation, config)), 1e-12)
+
+    containment = SpatialRelation(relation="in", category="containment")
+    assert apply_spatial_relation(point, containment) is point
+    assert isinstance(apply_spatial_relation_batch([point], [relation], [config])[0], Polygon)
+
+
+def test_buffer_resolution():
+    """Test that quad_segs controls the number of vertices of round buffers."""
+    geom = {"type": "Point", "coordinates": [7.44, 46.95]}
+    relation = SpatialRelation(relation="near", category="buffer")
+
+    default = apply_spatial_relation(geom, relation, BufferConfig(distance_m=5000, buffer_from="center"))
+    fine = apply_spatial_relation(geom, relation, BufferConfig(distance_m=5000, buffer_from="center", quad_segs=16))
+
+    assert len(default["coordinates"][0]) == 4 * 8 + 1  # closed ring
+    assert len(fine["coordinates"][0]) == 4 * 16 + 1
+
+
+def test_cached_and_uncached_results_match(monkeypatch):
+    """Test that results have the same GeoJSON structure whether or not they are memoized."""
+    geom = {"type": "Point", "coordinates": [7.44, 46.95]}
+    relation = SpatialRelation(relation="near", category="buffer")
+    config = BufferConfig(distance_m=1000, buffer_from="center")
+
+    cached = apply_spatial_relation(geom, relation, config)
+    monkeypatch.setattr(spatial, "_CACHE_MAX_GEOMETRY_CHARS", 0)  # Force the uncached path
+    uncached = apply_spatial_relation(geom, relation, config)
+
+    assert cached == uncached
+    assert type(cached["coordinates"][0][0]) is type(uncached["coordinates"][0][0])
@@ -2,15 +2,20 @@
 Tests for spatial relation configuration.
 """
 
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+
 import pytest
 
 from geollm.exceptions import UnknownRelationError
-from geollm.spatial_config import RelationConfig, SpatialRelationConfig
+from geollm.spatial_config import RelationCategory, RelationConfig, SpatialRelationConfig
 
 
 def test_default_relations_loaded():
     """Test that default relations are initialized."""
-    config = SpatialRelationConfig()
+    config = SpatialRelationConfig.default()
 
     # Check containment relations
     assert config.has_relation("in")
@@ -36,7 +41,7 @@ def test_default_relations_loaded():
 
 def test_get_config():
     """Test getting configuration for a relation."""
-    config = SpatialRelationConfig()
+    config = SpatialRelationConfig.default()
 
     near_config = config.get_config("near")
     assert near_config.name == "near"
@@ -46,7 +51,7 @@ def test_get_config():
 
 def test_get_unknown_relation():
     """Test that unknown relation raises error."""
-    config = SpatialRelationConfig()
+    config = SpatialRelationConfig.default()
 
     with pytest.raises(UnknownRelationError) as exc_info:
         config.get_config("unknown_relation")
@@ -73,9 +78,20 @@ def test_register_custom_relation():
     assert retrieved.default_distance_m == 500
 
 
+def test_relations_is_read_only():
+    """Test that relations can only be added through register_relation."""
+    config = SpatialRelationConfig()
+
+    with pytest.raises(TypeError):
+        config.relations["beside"] = RelationConfig(name="beside", category="buffer", description="Beside")  # ty: ignore[invalid-assignment]
+
+    assert not config.has_relation("beside")
+    assert set(config.relations) == set(config.list_relations())
+
+
 def test_list_relations():
     """Test listing relations."""
-    config = SpatialRelationConfig()
+    config = SpatialRelationConfig.default()
 
     all_relations = config.list_relations()
     assert "in" in all_relations
@@ -85,7 +101,7 @@ def test_list_relations():
 
 def test_list_relations_by_category():
     """Test listing relations filtered by category."""
-    config = SpatialRelationConfig()
+    config = SpatialRelationConfig.default()
 
     containment = config.list_relations(category="containment")
     assert "in" in containment
@@ -98,7 +114,7 @@ def test_list_relations_by_category():
 
 def test_format_for_prompt():
     """Test formatting relations for LLM prompt."""
-    config = SpatialRelationConfig()
+    config = SpatialRelationConfig.default()
 
     formatted = config.format_for_prompt()
 
@@ -118,7 +134,7 @@ def test_format_for_prompt():
 
 def test_directional_angles():
     """Test that directional relations have correct angle values."""
-    config = SpatialRelationConfig()
+    config = SpatialRelationConfig.default()
 
     # Cardinal directions (0° = North, clockwise)
     assert config.get_config("north_of").direction_angle_degrees == 0
@@ -131,3 +147,124 @@ def test_directional_angles():
     assert config.get_config("southeast_of").direction_angle_degrees == 135
     assert config.get_config("southwest_of").direction_angle_degrees == 225
     assert config.get_config("northwest_of").direction_angle_degrees == 315
+
+
+def test_default_is_shared():
+    """Test that the default registry is built once and reused."""
+    assert SpatialRelationConfig.default() is SpatialRelationConfig.default()
+    assert SpatialRelationConfig.default() is not SpatialRelationConfig()
+
+
+def test_custom_relation_before_first_use():
+    """Test that registering on a fresh registry keeps the built-in relations."""
+    config = SpatialRelationConfig()
+    config.register_relation(RelationConfig(name="beside", category="buffer", description="Next to"))
+
+    assert config.has_relation("beside")
+    assert config.has_relation("near")
+
+
+def test_reregister_relation_moves_category():
+    """Test that re-registering a relation under another category updates listings."""
+    config = SpatialRelationConfig()
+    config.register_relation(RelationConfig(name="near", category="directional", description="Redefined"))
+
+    assert "near" in config.list_relations(category="directional")
+    assert "near" not in config.list_relations(category="buffer")
+    assert config.list_relations().count("near") == 1
+
+
+def test_format_for_prompt_reflects_registration():
+    """Test that the cached prompt text is rebuilt after registering a relation."""
+    config = SpatialRelationConfig()
+    before = config.format_for_prompt()
+    assert config.format_for_prompt() is before
+
+    config.register_relation(RelationConfig(name="beside", category="buffer", description="Next to"))
+
+    assert "beside" not in before
+    assert "beside" in config.format_for_prompt()
+
+
+def test_relation_config_is_frozen_and_hashable():
+    """Test that relation configs are immutable value objects."""
+    config = SpatialRelationConfig.default().get_config("along")
+
+    with pytest.raises(AttributeError):
+        setattr(config, "default_distance_m", 1)
+
+    same = SpatialRelationConfig().get_config("along")
+    assert same == config
+    assert hash(same) == hash(config)
+    assert list(asdict(config)) == [
+        "name",
+        "category",
+        "description",
+        "default_distance_m",
+        "buffer_from",
+        "ring_only",
+        "sector_angle_degrees",
+        "direction_angle_degrees",
+        "applies_to",
+    ]
+
+
+def test_relation_category_accepts_strings():
+    """Test that string categories are normalized to RelationCategory."""
+    custom = RelationConfig(name="beside", category="buffer", description="Next to")
+
+    assert custom.category is RelationCategory.BUFFER
+    assert custom.category == "buffer"
+    assert str(custom.category) == "buffer"
+
+    with pytest.raises(ValueError):
+        RelationConfig(name="beside", category="nearby", description="Next to")  # ty: ignore[invalid-argument-type]
+
+
+def test_applies_to_normalized_to_tuple():
+    """Test that applies_to lists are stored as tuples."""
+    custom = RelationConfig(name="beside", category="buffer", description="Next to", applies_to=["road"])
+
+    assert custom.applies_to == ("road",)
+    assert hash(custom) == hash(
+        RelationConfig(name="beside", category="buffer", description="Next to", applies_to=("road",))
+    )
+
+
+def test_unknown_relation_lists_available():
+    """Test that the unknown relation error lists registered relations when formatted."""
+    config = SpatialRelationConfig.default()
+
+    with pytest.raises(UnknownRelationError) as exc_info:
+        config.get_config("unknown_relation")
+
+    assert exc_info.value.relation_name == "unknown_relation"
+    assert str(exc_info.value).endswith(f"Available relations: {', '.join(config.list_relations())}")
+
+
+def _race_first_lookups(n_threads: int, trials: int) -> None:
+    """Have threads perform the first lookup on fresh registries simultaneously."""
+    for _ in range(trials):
+        config = SpatialRelationConfig()
+        barrier = threading.Barrier(n_threads)
+
+        def lookup(_, config=config, barrier=barrier):
+            barrier.wait()
+            return config.get_config("northwest_of").direction_angle_degrees
+
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            results = list(executor.map(lookup, range(n_threads)))
+
+        assert results == [315] * n_threads
+        assert config.list_relations().count("near") == 1
+
+
+def test_lazy_initialization_is_thread_safe():
+    """Test that threads racing on a fresh registry all see the complete built-ins."""
+    # Switch threads as often as possible to widen any race window
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        _race_first_lookups(n_threads=8, trials=100)
+    finally:
+        sys.setswitchinterval(switch_interval)
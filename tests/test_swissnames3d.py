@@ -2,31 +2,135 @@
 Tests for SwissNames3DSource using both synthetic fixture and real shapefiles.
 """
 
+import copy
+import hashlib
+import importlib.util
+import os
 from pathlib import Path
+from typing import Any
 
+import geopandas as gpd
+import numpy as np
+import pandas as pd
 import pytest
+import shapely
 
-from geollm.datasources import SwissNames3DSource
+from geollm.datasources import SwissNames3DSource, swissnames3d
+
+from .conftest import DATA_DIR
 
 # Path to the synthetic fixture
 FIXTURE_PATH = Path(__file__).parent / "fixtures" / "swissnames3d_sample.json"
 
-# Path to real SwissNames3D shapefiles directory
-DATA_DIR = Path(__file__).parent.parent / "data"
+# pytest cache entry holding the loader source hash and the shapefile (name, mtime, size) list
+# the GeoParquet copy was built from
+_PARQUET_CACHE_KEY = "geollm/swissnames3d_parquet"
+
+# Regions (minx, miny, maxx, maxy in EPSG:2056) for tests that target a known area
+_LAKE_GENEVA_BBOX = (2495000, 1110000, 2565000, 1160000)
+_MURG_THURGAU_BBOX = (2700000, 1250000, 2730000, 1280000)
+
 
+# Sources are session-scoped and shared by all tests: treat their _gdf as read-only
 
-@pytest.fixture
+# Fixtures that read DATA_DIR: conftest.py skips the tests using them when it is absent
+REAL_DATA_FIXTURES = frozenset({"real_source", "real_source_uncached", "real_source_region"})
+
+
+@pytest.fixture(scope="session")
 def source():
     """Create a SwissNames3DSource instance using the fixture."""
     return SwissNames3DSource(FIXTURE_PATH)
 
 
-@pytest.fixture
-def real_source():
-    """Create a SwissNames3DSource instance using real shapefiles."""
+@pytest.fixture(scope="session")
+def real_source_uncached():
+    """
+    Create a SwissNames3DSource instance reading the real shapefiles, loaded once per session.
+
+    Unlike real_source, this always runs the shapefile loader: use it to test loading.
+    """
+    if not DATA_DIR.exists():
+        pytest.skip("Real SwissNames3D data directory not found")
+
+    real = SwissNames3DSource(DATA_DIR)
+    with pytest.MonkeyPatch.context() as mp:
+        # Read through Arrow when available (much faster decoding of the ~440k features)
+        if importlib.util.find_spec("pyarrow") is not None:
+            mp.setenv("PYOGRIO_USE_ARROW", "1")
+        real._ensure_loaded()
+    return real
+
+
+@pytest.fixture(scope="session")
+def real_source(request, pytestconfig):
+    """
+    Create a SwissNames3DSource instance using real shapefiles, loaded once per session.
+
+    When pyarrow is available, the loaded GeoDataFrame is also cached as GeoParquet
+    under .pytest_cache and reused by later runs until the shapefiles or the loader change.
+    """
     if not DATA_DIR.exists():
         pytest.skip("Real SwissNames3D data directory not found")
-    return SwissNames3DSource(DATA_DIR)
+    has_arrow = importlib.util.find_spec("pyarrow") is not None
+
+    cache_path = pytestconfig.cache.mkdir("swissnames3d") / "swissnames3d.parquet"
+    cache_key = {
+        "loader": hashlib.sha256(Path(swissnames3d.__file__).read_bytes()).hexdigest(),
+        "files": [[path.name, path.stat().st_mtime_ns, path.stat().st_size] for path in sorted(DATA_DIR.iterdir())],
+    }
+
+    if has_arrow and cache_path.exists() and pytestconfig.cache.get(_PARQUET_CACHE_KEY, None) == cache_key:
+        return SwissNames3DSource.from_geodataframe(gpd.read_parquet(cache_path))
+
+    # Cache miss: share the session's shapefile load
+    real = request.getfixturevalue("real_source_uncached")
+    if has_arrow:
+        assert real._gdf is not None
+        # Write then rename, so that concurrent pytest-xdist workers never read a partial file
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        real._gdf.to_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, cache_path)
+        pytestconfig.cache.set(_PARQUET_CACHE_KEY, cache_key)
+    return real
+
+
+@pytest.fixture(scope="session")
+def real_search(real_source):
+    """
+    Memoized `real_source.search`, as several tests repeat the same searches.
+
+    Each call returns a deep copy of the cached features, so tests may modify them.
+    """
+    results: dict[tuple[str, str | None, int], list[dict[str, Any]]] = {}
+
+    def _search(name: str, type: str | None = None, max_results: int = 10) -> list[dict[str, Any]]:
+        key = (name, type, max_results)
+        if key not in results:
+            results[key] = real_source.search(name, type=type, max_results=max_results)
+        return copy.deepcopy(results[key])
+
+    return _search
+
+
+@pytest.fixture(scope="session")
+def real_source_region():
+    """
+    Factory returning a SwissNames3DSource over real shapefiles restricted to a bounding box.
+
+    Only features in the box are read, so these sources load in a fraction of the time
+    of the full dataset. Each box is loaded once per session.
+    """
+    if not DATA_DIR.exists():
+        pytest.skip("Real SwissNames3D data directory not found")
+    sources: dict[tuple[float, float, float, float], SwissNames3DSource] = {}
+
+    def _region(bbox: tuple[float, float, float, float]) -> SwissNames3DSource:
+        if bbox not in sources:
+            sources[bbox] = SwissNames3DSource(DATA_DIR, bbox=bbox)
+        return sources[bbox]
+
+    return _region
 
 
 def test_load_data(source):
@@ -34,18 +138,50 @@ def test_load_data(source):
     source._ensure_loaded()
     assert source._gdf is not None
     assert len(source._gdf) == 5  # 5 features in fixture
+    # Few distinct types: stored as a categorical column
+    assert isinstance(source._gdf["OBJEKTART"].dtype, pd.CategoricalDtype)
+
+
+def test_load_bbox():
+    """Test that only features intersecting the bounding box are loaded."""
+    regional = SwissNames3DSource(FIXTURE_PATH, bbox=_LAKE_GENEVA_BBOX)
+    regional._ensure_loaded()
+    assert regional._gdf is not None
+    assert "Zürich" not in set(regional._gdf["NAME"])
+    assert len(regional.search("Lac Léman")) == 1
+
+
+def test_from_geodataframe(source):
+    """Test that a source over a preloaded GeoDataFrame matches one loaded from disk."""
+    gdf = gpd.read_file(FIXTURE_PATH)
+    dtypes = gdf.dtypes.copy()
+    preloaded = SwissNames3DSource.from_geodataframe(gdf)
+    assert preloaded._gdf is not None
+    assert isinstance(preloaded._gdf["OBJEKTART"].dtype, pd.CategoricalDtype)
+    # The caller's frame keeps its dtypes
+    pd.testing.assert_series_equal(gdf.dtypes, dtypes)
+    for name in ("Bern", "leman", "Rhône"):
+        assert preloaded.search(name) == source.search(name)
 
 
 def test_search_exact(source):
     """Test exact name matching."""
-    results = source.search("Bern")
+    results = source.search_df("Bern")
     assert len(results) == 2  # Fixture has 2 Bern entries
-    names = {r["properties"]["name"] for r in results}
-    assert "Bern" in names
+    assert "Bern" in set(results["NAME"])
     # Note: "Kanton" is not in OBJEKTART_TYPE_MAP (removed as dead mapping)
     # SwissNames3D real data doesn't contain canton entries
 
 
+def test_search_df_matches_search(source):
+    """Test that search_df returns the same features as search, as GeoDataFrame rows."""
+    for name, type in (("Bern", None), ("Bern", "city"), ("leman", None), ("Nowhere", None)):
+        features = source.search(name, type=type)
+        rows = source.search_df(name, type=type)
+        assert isinstance(rows, gpd.GeoDataFrame)
+        assert list(rows["UUID"]) == [f["id"] for f in features]
+
+
 def test_structure(source):
     """Test GeoJSON structure."""
     results = source.search("Bern")
@@ -106,6 +242,12 @@ def test_get_by_id(source):
     assert feature["properties"]["type"] == "river"
 
 
+def test_fuzzy_search_token_match(source):
+    """Test fuzzy fallback on a partial name sharing a token (Leman -> Lac Léman)."""
+    results = source.search("Leman")
+    assert [r["properties"]["name"] for r in results] == ["Lac Léman"]
+
+
 def test_unknown_name(source):
     """Test searching for non-existent name."""
     results = source.search("Atlantis")
@@ -115,28 +257,29 @@ def test_unknown_name(source):
 # Tests for real SwissNames3D shapefiles
 
 
-def test_real_load_from_directory(real_source):
+def test_real_load_from_directory(real_source_uncached):
     """Test loading all 3 shapefiles from directory."""
-    real_source._ensure_loaded()
-    assert real_source._gdf is not None
+    real_source_uncached._ensure_loaded()
+    assert real_source_uncached._gdf is not None
     # Should have combined all 3 files (PKT: 334,738 + LIN: 12,571 + PLY: 95,155)
-    assert len(real_source._gdf) > 400000  # Combined features
+    assert len(real_source_uncached._gdf) > 400000  # Combined features
 
 
-def test_real_multiple_geometry_types(real_source):
+def test_real_multiple_geometry_types(real_source_uncached):
     """Test that all geometry types are loaded."""
-    real_source._ensure_loaded()
-    geom_types = set(real_source._gdf.geom_type.unique())
+    real_source_uncached._ensure_loaded()
+    # Compare integer type ids (one vectorized pass) rather than per-row geom_type strings
+    type_ids = set(np.unique(shapely.get_type_id(real_source_uncached._gdf.geometry.values)).tolist())
     # Should have Point, LineString, and Polygon
-    assert "Point" in geom_types
-    assert "LineString" in geom_types
-    assert "Polygon" in geom_types
+    assert shapely.GeometryType.POINT in type_ids
+    assert shapely.GeometryType.LINESTRING in type_ids
+    assert shapely.GeometryType.POLYGON in type_ids
 
 
-def test_real_common_columns_only(real_source):
+def test_real_common_columns_only(real_source_uncached):
     """Test that only common columns are kept after concatenation."""
-    real_source._ensure_loaded()
-    columns = set(real_source._gdf.columns)
+    real_source_uncached._ensure_loaded()
+    columns = set(real_source_uncached._gdf.columns)
 
     # Should have common columns
     expected_common = {
@@ -163,27 +306,26 @@ def test_real_common_columns_only(real_source):
 def test_real_search_across_geometry_types(real_source):
     """Test searching returns results from different geometry types."""
     # "Bern" should exist as both point (city) and polygon (municipality)
-    results = real_source.search("Bern")
+    results = real_source.search_df("Bern")
     assert len(results) > 0
 
     # Check we have results with different geometry types
-    geom_types = {r["geometry"]["type"] for r in results}
-    assert len(geom_types) > 1  # Should have multiple geometry types
+    assert results.geom_type.nunique() > 1  # Should have multiple geometry types
 
 
-def test_real_search_river(real_source):
+def test_real_search_river(real_source_region):
     """Test searching for a river (LineString geometry)."""
     # Use a river that exists in the dataset
-    results = real_source.search("Murg")
+    results = real_source_region(_MURG_THURGAU_BBOX).search("Murg")
     assert len(results) > 0
     # At least one result should be a LineString (rivers)
     geom_types = {r["geometry"]["type"] for r in results}
     assert "LineString" in geom_types or "MultiLineString" in geom_types
 
 
-def test_real_search_lake(real_source):
+def test_real_search_lake(real_source_region):
     """Test searching for a lake (Polygon geometry)."""
-    results = real_source.search("Genfersee", type="lake")
+    results = real_source_region(_LAKE_GENEVA_BBOX).search("Genfersee", type="lake")
     if len(results) > 0:  # Lake might be named differently
         # Should be Polygon or MultiPolygon
         geom_types = {r["geometry"]["type"] for r in results}
@@ -193,25 +335,25 @@ def test_real_search_lake(real_source):
 def test_fuzzy_search_partial_name(real_source):
     """Test fuzzy matching for partial river names (e.g., 'Venoge' matching 'La Venoge')."""
     # Search for "Venoge" without "La" should still match "La Venoge" via fuzzy matching
-    results = real_source.search("Venoge", type="river")
+    results = real_source.search_df("Venoge", type="river")
     assert len(results) > 0, "Should find 'La Venoge' when searching for 'Venoge'"
-    names = [r["properties"]["name"] for r in results]
+    names = list(results["NAME"])
     assert any("Venoge" in name for name in names), f"Expected name containing 'Venoge' in {names}"
 
 
 def test_fuzzy_search_case_insensitive_partial(real_source):
     """Test fuzzy matching is case-insensitive for partial names."""
-    results = real_source.search("venoge", type="river")
+    results = real_source.search_df("venoge", type="river")
     assert len(results) > 0, "Should find 'La Venoge' when searching for lowercase 'venoge'"
-    names = [r["properties"]["name"] for r in results]
+    names = list(results["NAME"])
     assert any("Venoge" in name for name in names), f"Expected name containing 'Venoge' in {names}"
 
 
-def test_fuzzy_search_with_type_filter(real_source):
+def test_fuzzy_search_with_type_filter(real_search):
     """Test that fuzzy search results can be filtered by type."""
     # Without type filter, should get multiple results of different types
-    all_results = real_source.search("Venoge")
-    river_results = real_source.search("Venoge", type="river")
+    all_results = real_search("Venoge")
+    river_results = real_search("Venoge", type="river")
 
     # River results should be a subset of all results
     assert len(river_results) <= len(all_results)
@@ -221,7 +363,7 @@ def test_fuzzy_search_with_type_filter(real_source):
         assert result["properties"]["type"] == "river", f"Expected type 'river', got {result['properties']['type']}"
 
 
-def test_multiple_disconnected_segments(real_source):
+def test_multiple_disconnected_segments(real_search):
     """Test searching for entities with disconnected segments (e.g., river split by lake).
 
     La Venoge is split into two segments by a lake. This test verifies that:
@@ -229,7 +371,7 @@ def test_multiple_disconnected_segments(real_source):
     2. Each segment is independent (not connected)
     3. Segments have different geometry properties (different coordinate counts)
     """
-    results = real_source.search("Venoge", type="river")
+    results = real_search("Venoge", type="river")
 
     # Should find multiple river segments with the same name
     assert len(results) >= 2, f"Expected at least 2 segments for La Venoge, got {len(results)}"
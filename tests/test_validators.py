@@ -2,8 +2,6 @@
 Tests for validation logic.
 """
 
-import warnings
-
 import pytest
 
 from geollm.exceptions import LowConfidenceError, LowConfidenceWarning, UnknownRelationError
@@ -25,31 +23,35 @@ from geollm.validators import (
 
 @pytest.fixture
 def spatial_config():
-    """Fixture for spatial config."""
-    return SpatialRelationConfig()
+    """Fixture for spatial config (the shared built-in registry; tests must not register relations)."""
+    return SpatialRelationConfig.default()
+
+
+# Validated once; tests get deep copies since they mutate the query in place
+_SAMPLE_QUERY = GeoQuery(
+    query_type="simple",
+    spatial_relation=SpatialRelation(
+        relation="in",
+        category="containment",
+    ),
+    reference_location=ReferenceLocation(
+        name="Bern",
+        type="city",
+    ),
+    buffer_config=None,
+    confidence_breakdown=ConfidenceScore(
+        overall=0.85,
+        location_confidence=0.90,
+        relation_confidence=0.80,
+    ),
+    original_query="in Bern",
+)
 
 
 @pytest.fixture
 def sample_query():
     """Fixture for a sample query."""
-    return GeoQuery(
-        query_type="simple",
-        spatial_relation=SpatialRelation(
-            relation="in",
-            category="containment",
-        ),
-        reference_location=ReferenceLocation(
-            name="Bern",
-            type="city",
-        ),
-        buffer_config=None,
-        confidence_breakdown=ConfidenceScore(
-            overall=0.85,
-            location_confidence=0.90,
-            relation_confidence=0.80,
-        ),
-        original_query="in Bern",
-    )
+    return _SAMPLE_QUERY.model_copy(deep=True)
 
 
 def test_validate_known_relation(spatial_config, sample_query):
@@ -148,12 +150,10 @@ def test_confidence_below_threshold_permissive(sample_query):
     """Test low confidence in permissive mode emits warning."""
     sample_query.confidence_breakdown.overall = 0.50
 
-    with warnings.catch_warnings(record=True) as w:
-        warnings.simplefilter("always")
+    with pytest.warns(LowConfidenceWarning) as record:
         check_confidence_threshold(sample_query, threshold=0.6, strict=False)
 
-        assert len(w) == 1
-        assert issubclass(w[0].category, LowConfidenceWarning)
+    assert len(record) == 1
 
 
 def test_confidence_below_threshold_strict(sample_query):